@@ -185,8 +185,12 @@ class APIClient:
             except ValueError:
                 error_message = e.response.text
             
-            # Return both a human-readable message and the parsed response    
-            return False, {"message": f"Error {e.response.status_code}: {error_message}", "raw_response": parsed_response}
+            # Return a human-readable message, the parsed response and the status
+            return False, {
+                "message": f"Error {e.response.status_code}: {error_message}",
+                "raw_response": parsed_response,
+                "status_code": e.response.status_code,
+            }
         
         except Exception as e:
             self.last_error = f"Unexpected error: {str(e)}"
@@ -415,6 +419,44 @@ class APIClient:
             'PUT', f'/domains/{domain_name}/rrsets/', rrsets
         )
 
+    def bulk_create_records(self, domain_name, rrsets):
+        """
+        Create multiple RRsets in a single API call (POST bulk).
+
+        The request is atomic: if any RRset already exists or is invalid,
+        none of them are created.
+
+        Args:
+            domain_name (str): Domain name
+            rrsets (list[dict]): List of RRset dicts, each with
+                subname, type, ttl, records keys.
+
+        Returns:
+            tuple: (success, response data or error message)
+        """
+        return self._make_request(
+            'POST', f'/domains/{domain_name}/rrsets/', rrsets
+        )
+
+    def bulk_update_records(self, domain_name, rrsets):
+        """
+        Modify multiple RRsets in a single API call (PATCH bulk).
+
+        RRsets are created or updated as given; an RRset with an empty
+        records list is deleted.  The request is atomic.
+
+        Args:
+            domain_name (str): Domain name
+            rrsets (list[dict]): List of RRset dicts, each with subname,
+                type and records keys (ttl optional for deletions).
+
+        Returns:
+            tuple: (success, response data or error message)
+        """
+        return self._make_request(
+            'PATCH', f'/domains/{domain_name}/rrsets/', rrsets
+        )
+
     def delete_record(self, domain_name, subname, type):
         """
         Delete a DNS record.
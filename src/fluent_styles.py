@@ -9,6 +9,8 @@ inherit the Fluent dark/light palette automatically.  The helpers here make them
 transparent *and* set the correct text colour for the active theme.
 """
 
+from functools import lru_cache
+
 from qfluentwidgets import isDarkTheme
 
 # ── Light/dark text colour tokens ────────────────────────────────────────────
@@ -28,7 +30,13 @@ def combo_qss() -> str:
     the rules have highest priority and are not overridden by parent
     widget styles (e.g. qfluentwidgets SettingCard internals).
     """
-    dark = isDarkTheme()
+    return _combo_qss(isDarkTheme())
+
+
+# The QSS builders below depend only on the light/dark flag, so each
+# string is built once per theme and shared by every caller.
+@lru_cache(maxsize=2)
+def _combo_qss(dark: bool) -> str:
     tc = _DARK_TEXT if dark else _LIGHT_TEXT
     combo_bg = "rgba(50,50,50,0.95)" if dark else "rgba(255,255,255,0.9)"
     combo_border = "rgba(255,255,255,0.08)" if dark else "rgba(0,0,0,0.12)"
@@ -62,7 +70,11 @@ def combo_qss() -> str:
 
 def container_qss() -> str:
     """QSS for QTabWidget / QGroupBox / QLabel / form widgets — theme-aware."""
-    dark = isDarkTheme()
+    return _container_qss(isDarkTheme())
+
+
+@lru_cache(maxsize=2)
+def _container_qss(dark: bool) -> str:
     tc = _DARK_TEXT if dark else _LIGHT_TEXT
     dialog_bg = "rgba(43,43,43,1)" if dark else "rgba(255,255,255,1)"
     tab_bg = "rgba(50,50,50,0.9)" if dark else "rgba(240,240,240,0.9)"
@@ -104,7 +116,7 @@ def container_qss() -> str:
         f"QCheckBox {{"
         f"  color: {tc};"
         f"}}"
-        + combo_qss()
+        + _combo_qss(dark)
     )
 
 
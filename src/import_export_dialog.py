@@ -9,14 +9,18 @@ Both use the standard two-pane splitter layout:
   Import — left: file selection + preview, right: settings / target / mode
 """
 
+import operator
 import os
-from datetime import datetime
+import threading
+import time
+from collections import OrderedDict
+from types import MappingProxyType
 from PySide6 import QtWidgets, QtCore, QtGui
-from PySide6.QtCore import Signal, QThread, Qt
-from import_export_manager import ImportExportManager
+from PySide6.QtCore import Signal, QObject, QRunnable, QThreadPool, QTimer, Qt
+from import_export_manager import ImportExportManager, OperationCancelled
 from qfluentwidgets import (
     PushButton, PrimaryPushButton, ProgressBar, LineEdit, CheckBox,
-    TextEdit, ListView, SearchLineEdit, StrongBodyLabel, CaptionLabel,
+    PlainTextEdit, ListView, SearchLineEdit, StrongBodyLabel, CaptionLabel,
     InfoBar, InfoBarPosition,
 )
 import logging
@@ -25,38 +29,240 @@ from confirm_drawer import ConfirmDrawer
 
 logger = logging.getLogger(__name__)
 
+# Records parsed for the import preview; the rest of the file is estimated
+PREVIEW_RECORD_LIMIT = 64
 
-class ImportExportWorker(QThread):
-    """Worker thread for import/export operations."""
+# Import previews kept per session (least recently used are dropped)
+PREVIEW_CACHE_SIZE = 16
 
-    finished = Signal(bool, str, object)  # success, message, data
-    progress = Signal(str)  # progress message
-    progress_update = Signal(int, str)  # percentage, status message
+# Open-dialog filter for import files
+_IMPORT_FILE_FILTER = (
+    "All Supported (*.json *.yaml *.yml *.zone *.data *.txt);;"
+    "JSON Files (*.json);;YAML Files (*.yaml *.yml);;"
+    "Zone Files (*.zone *.txt);;Data Files (*.data *.txt);;"
+    "All Files (*)"
+)
+
+# First entry of the target-zone combo: import into the zone named in the file
+_USE_FILE_ZONE = "[Use zone name from file]"
+
+# Confirmation drawer labels per existing-records mode
+_IMPORT_MODE_LABELS = MappingProxyType({
+    'replace': "Replace (delete existing records first)",
+    'merge': "Merge (update matching records)",
+    'append': "Append (keep existing)",
+})
+
+# Status line shown under the progress bar
+_format_progress = "{}% \u2014 {}".format
+
+# One preview line per record: subname, type, joined contents
+_PREVIEW_TMPL = "{s:<15} {t:<8} {c}"
+_get_preview_fields = operator.itemgetter('subname', 'type', 'records')
+
+
+def _format_preview_record(record):
+    """Render one record as a fixed-width preview line."""
+    try:
+        s, t, rs = _get_preview_fields(record)
+    except KeyError:
+        s = record.get('subname', '@')
+        t = record.get('type', 'Unknown')
+        rs = record.get('records', [])
+    return _PREVIEW_TMPL.format_map({'s': s, 't': t, 'c': ', '.join(rs)})
+
+
+def _set_status_text(label, text):
+    """Set a status label, eliding long text and keeping the full text as tooltip."""
+    width = max(label.width() * 2, 200)
+    label.setText(
+        label.fontMetrics().elidedText(text, Qt.TextElideMode.ElideRight, width)
+    )
+    label.setToolTip(text)
+
+
+def _build_format_radios(layout, button_group, on_selected, default='json'):
+    """Create one radio button per supported format.
+
+    The format key is kept as a plain Python attribute (``_format_key``)
+    and ``on_selected(key)`` is called whenever a radio becomes checked.
+    """
+    radios = []
+    for fmt_key, fmt_desc in ImportExportManager.SUPPORTED_FORMATS.items():
+        radio = QtWidgets.QRadioButton(fmt_desc)
+        radio._format_key = fmt_key
+        radio.toggled.connect(
+            lambda checked, k=fmt_key: checked and on_selected(k)
+        )
+        button_group.addButton(radio)
+        layout.addWidget(radio)
+        radios.append(radio)
+    defaults = [r for r in radios if r._format_key == default]
+    if defaults:
+        defaults[0].setChecked(True)
+    return radios
+
+
+# Save-dialog filters per export format
+_FILE_FILTERS = MappingProxyType({
+    'json': 'JSON Files (*.json *.json.gz)',
+    'yaml': 'YAML Files (*.yaml *.yml *.yaml.gz *.yml.gz)',
+    'bind': 'Zone Files (*.zone *.txt)',
+    'djbdns': 'Data Files (*.data *.txt)'
+})
+
+# Save-dialog filter for bulk exports
+_ZIP_FILE_FILTER = "ZIP files (*.zip)"
+
+# Bulk-export archive choices: label -> (compression, compresslevel).
+# Level 1 deflate is several times faster than the default 6 on zone text
+# for a slightly larger archive, so it is the default (first) choice.
+_ZIP_PRESETS = MappingProxyType({
+    "Fast (light compression)": ('deflate', 1),
+    "Small (best compression)": ('deflate', 9),
+    "None (store only)": ('stored', 0),
+})
+
+
+# Skip per-entry symlink resolution and custom folder icons, which stat every
+# entry and stall the dialog on large or network-mounted directories
+_FILE_DIALOG_OPTIONS = (
+    QtWidgets.QFileDialog.Option.DontResolveSymlinks
+    | QtWidgets.QFileDialog.Option.DontUseCustomDirectoryIcons
+)
+
+
+def _open_save_dialog(parent, title, filename, file_filter, on_selected):
+    """Show a window-modal save dialog without blocking in a nested loop.
+
+    ``on_selected(path)`` is called only if the user accepts.
+    """
+    dlg = QtWidgets.QFileDialog(parent, title, "", file_filter)
+    dlg.setOptions(_FILE_DIALOG_OPTIONS)
+    dlg.setAcceptMode(QtWidgets.QFileDialog.AcceptMode.AcceptSave)
+    dlg.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+    if filename:
+        dlg.selectFile(filename)
+    dlg.fileSelected.connect(on_selected)
+    dlg.open()
+
+
+class ExportZoneModel(QtCore.QAbstractListModel):
+    """Zone-name list model for the export page.
+
+    Names are kept as plain Python strings alongside a parallel list of
+    lower-cased names, so filtering never re-lowers every zone and
+    selected rows map straight back to ``filtered_zones``.
+    """
+
+    def __init__(self, zones=None, parent=None):
+        super().__init__(parent)
+        self.zones = []
+        self._lower_zones = []
+        self.filtered_zones = []
+        self.filter_text = ""
+        self.set_zones(zones or [])
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.filtered_zones)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            return self.filtered_zones[index.row()]
+        return None
+
+    def set_zones(self, zones):
+        """Replace the zone names, keeping the current filter."""
+        self.beginResetModel()
+        self.zones = zones
+        self._lower_zones = [z.lower() for z in zones]
+        self._apply_filter()
+        self.endResetModel()
+
+    def set_filter(self, filter_text):
+        """Filter by case-insensitive substring. Returns True if it changed."""
+        filter_text = filter_text.strip().lower()
+        if filter_text == self.filter_text:
+            return False
+        self.beginResetModel()
+        self.filter_text = filter_text
+        self._apply_filter()
+        self.endResetModel()
+        return True
+
+    def _apply_filter(self):
+        ft = self.filter_text
+        if ft:
+            self.filtered_zones = [
+                z for z, lz in zip(self.zones, self._lower_zones) if ft in lz
+            ]
+        else:
+            self.filtered_zones = self.zones
+
+
+class ImportExportWorker(QRunnable):
+    """Thread-pool worker for a single import/export operation."""
+
+    class Signals(QObject):
+        """Signal wrapper for thread-safe communication with the main thread."""
+        finished = Signal(bool, str, object)  # success, message, data
+        progress = Signal(str)  # progress message
 
     def __init__(self, manager, operation, **kwargs):
+        """Initialize the worker.
+
+        Args:
+            manager: ImportExportManager instance
+            operation: 'export', 'bulk_export' or 'import'
+            **kwargs: Arguments for the matching manager method
+        """
         super().__init__()
         self.manager = manager
         self.operation = operation
         self.kwargs = kwargs
+        self.signals = self.Signals()
+        self._cancel_event = threading.Event()
+        # Latest (percentage, status); polled by the page's progress timer
+        self.progress_state = None
+
+    def cancel(self):
+        """Ask the operation to stop before its next zone or API batch.
+
+        Returns immediately; ``finished`` is emitted once the operation
+        has unwound, or with its real result if it completed first.
+        """
+        self._cancel_event.set()
 
     def run(self):
         try:
             if self.operation == 'export':
                 success, message = self.manager.export_zone(**self.kwargs)
-                self.finished.emit(success, message, None)
+                result = (success, message, None)
             elif self.operation == 'bulk_export':
                 self.kwargs['progress_callback'] = self._emit_progress
+                self.kwargs['cancel_check'] = self._cancel_event.is_set
                 success, message = self.manager.export_zones_bulk(**self.kwargs)
-                self.finished.emit(success, message, None)
+                result = (success, message, None)
             elif self.operation == 'import':
                 self.kwargs['progress_callback'] = self._emit_progress
-                success, message, data = self.manager.import_zone(**self.kwargs)
-                self.finished.emit(success, message, data)
+                self.kwargs['cancel_check'] = self._cancel_event.is_set
+                result = self.manager.import_zone(**self.kwargs)
+            else:
+                result = (False, f"Unknown operation: {self.operation}", None)
+        except OperationCancelled:
+            # Only an operation that actually unwound counts as cancelled;
+            # work that completed despite a late cancel reports its result
+            result = (False, "Operation cancelled", None)
         except Exception as e:
-            self.finished.emit(False, f"Operation failed: {str(e)}", None)
+            result = (False, f"Operation failed: {str(e)}", None)
+        self.signals.finished.emit(*result)
 
     def _emit_progress(self, percentage, status):
-        self.progress_update.emit(percentage, status)
+        # Never raises: cancellation is checked by the manager through
+        # cancel_check at its loop boundaries, not on every progress step.
+        # A single reference store (atomic under the GIL); no cross-thread
+        # event is posted, the UI thread picks it up on its next poll
+        self.progress_state = (percentage, status)
 
 
 # ======================================================================
@@ -73,20 +279,81 @@ class ExportInterface(QtWidgets.QWidget):
         self.setObjectName("exportInterface")
         self.import_export_manager = import_export_manager
         self.available_zones = available_zones or []
+        self.pool = QThreadPool.globalInstance()
         self.worker = None
-        self.setup_ui()
+        self._finished_handler = None
+        self._shown_progress = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(16)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        self._current_export_format = 'json'
+        self._current_export_filter = _FILE_FILTERS['json']
+        # Directory of the last export; seeds the save dialog
+        self._last_export_dir = ""
+        # Selected zone names; None until recomputed after a selection change
+        self._selected_zones = None
+        self._last_zone_count = -1
+        self._selection_updating = False
+        self._export_btn_timer = QTimer(self)
+        self._export_btn_timer.setSingleShot(True)
+        self._export_btn_timer.setInterval(50)
+        self._export_btn_timer.timeout.connect(self._apply_export_btn_text)
+        # Widgets are built on first show so startup doesn't pay for them
+        self._ui_built = False
+        self._applied_qss = None
 
     def showEvent(self, event):
+        if not self._ui_built:
+            # Build the whole tree before the first paint/layout pass
+            self.setUpdatesEnabled(False)
+            try:
+                self.setup_ui()
+            finally:
+                self.setUpdatesEnabled(True)
+            self._ui_built = True
         super().showEvent(event)
-        self.setStyleSheet(container_qss())
+        # Re-polishing the subtree is costly; only redo it after a theme change
+        qss = container_qss()
+        if qss != self._applied_qss:
+            self._applied_qss = qss
+            self.setStyleSheet(qss)
         self.zones_refresh_requested.emit()
 
     def hideEvent(self, event):
-        if self.worker and self.worker.isRunning():
-            self.worker.terminate()
-            self.worker.wait()
+        if self.worker is not None:
+            # Cooperative: the finished handler resets the UI once it stops
+            self.worker.cancel()
         super().hideEvent(event)
 
+    def stop_worker(self):
+        """Cancel any running operation (call on application shutdown)."""
+        if self.worker is not None:
+            # Detach first so nothing queued lands on a closing page
+            self.worker.signals.finished.disconnect(self._on_worker_finished)
+            self.worker.cancel()
+            self.worker = None
+
+    def _run_operation(self, operation, on_finished, **kwargs):
+        if self.worker is not None:
+            # Ignore repeated clicks while an operation is in flight
+            return
+        self._finished_handler = on_finished
+        self.set_operation_running(True)
+        self.worker = ImportExportWorker(
+            self.import_export_manager, operation, **kwargs
+        )
+        self.worker.signals.finished.connect(
+            self._on_worker_finished, Qt.ConnectionType.QueuedConnection
+        )
+        self.pool.start(self.worker)
+
+    def _on_worker_finished(self, success, message, data):
+        self.worker = None
+        handler, self._finished_handler = self._finished_handler, None
+        if handler is None:
+            return
+        handler(success, message, data)
+
     def setup_ui(self):
         outer = QtWidgets.QVBoxLayout(self)
         outer.setContentsMargins(0, 0, 0, 0)
@@ -108,7 +375,8 @@ class ExportInterface(QtWidgets.QWidget):
         title_row.setContentsMargins(0, 0, 0, 0)
         title_row.addWidget(StrongBodyLabel("Zones"))
         title_row.addStretch()
-        self._zone_count_label = CaptionLabel("0 zones")
+        self._zone_count_label = CaptionLabel()
+        self._set_zone_count(len(self.available_zones))
         title_row.addWidget(self._zone_count_label)
         left_lay.addLayout(title_row)
 
@@ -118,7 +386,7 @@ class ExportInterface(QtWidgets.QWidget):
         left_lay.addWidget(self._zone_search)
 
         # Zone list view with Ctrl/Shift multi-select (no checkboxes)
-        self._zone_model = QtCore.QStringListModel(self.available_zones)
+        self._zone_model = ExportZoneModel(self.available_zones, self)
         self._zone_list = ListView()
         self._zone_list.setModel(self._zone_model)
         self._zone_list.setSelectionMode(
@@ -128,7 +396,7 @@ class ExportInterface(QtWidgets.QWidget):
             QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers
         )
         self._zone_list.setAlternatingRowColors(True)
-        self._zone_list.selectionModel().selectionChanged.connect(self._update_export_btn)
+        self._zone_list.selectionModel().selectionChanged.connect(self._on_zone_selection_changed)
         left_lay.addWidget(self._zone_list)
 
         # Select all / none buttons
@@ -156,14 +424,9 @@ class ExportInterface(QtWidgets.QWidget):
         format_group = QtWidgets.QGroupBox("Format")
         format_layout = QtWidgets.QVBoxLayout(format_group)
         self.export_format_group = QtWidgets.QButtonGroup()
-        formats = ImportExportManager.SUPPORTED_FORMATS
-        for fmt_key, fmt_desc in formats.items():
-            radio = QtWidgets.QRadioButton(fmt_desc)
-            radio.setProperty('format', fmt_key)
-            self.export_format_group.addButton(radio)
-            format_layout.addWidget(radio)
-            if fmt_key == 'json':
-                radio.setChecked(True)
+        self._export_format_radios = _build_format_radios(
+            format_layout, self.export_format_group, self._set_export_format
+        )
         right_lay.addWidget(format_group)
 
         # Options
@@ -172,6 +435,20 @@ class ExportInterface(QtWidgets.QWidget):
         self.include_metadata_cb = CheckBox("Include metadata (timestamps, etc.)")
         self.include_metadata_cb.setChecked(True)
         options_layout.addWidget(self.include_metadata_cb)
+        options_layout.addWidget(CaptionLabel("Multi-zone ZIP archive:"))
+        self.zip_compression_group = QtWidgets.QButtonGroup()
+        self._zip_radios = []
+        for label, preset in _ZIP_PRESETS.items():
+            radio = QtWidgets.QRadioButton(label)
+            radio._zip_preset = preset
+            self.zip_compression_group.addButton(radio)
+            options_layout.addWidget(radio)
+            self._zip_radios.append(radio)
+        self._zip_radios[0].setChecked(True)
+        self.update_archive_cb = CheckBox(
+            "Update existing archive (only re-export changed zones)"
+        )
+        options_layout.addWidget(self.update_archive_cb)
         right_lay.addWidget(options_group)
 
         # Output file
@@ -221,37 +498,80 @@ class ExportInterface(QtWidgets.QWidget):
     # ------------------------------------------------------------------
 
     def update_zones(self, available_zones):
-        self.available_zones = available_zones or []
-        self._zone_model.setStringList(self.available_zones)
-        self._zone_count_label.setText(
-            f"{len(self.available_zones)} zone{'s' if len(self.available_zones) != 1 else ''}"
-        )
+        available_zones = available_zones or []
+        if available_zones == self.available_zones:
+            # Unchanged since the last refresh — keep the model and selection
+            return
+        self.available_zones = available_zones
+        if not self._ui_built:
+            # setup_ui picks the list up on first show
+            return
+        self._zone_model.set_zones(self.available_zones)
+        # A model reset drops the selection without emitting selectionChanged
+        self._on_zone_selection_changed()
+        self._set_zone_count(self._zone_model.rowCount())
 
     def _filter_zones(self, text):
-        ft = text.strip().lower()
-        if ft:
-            filtered = [z for z in self.available_zones if ft in z.lower()]
-        else:
-            filtered = self.available_zones
-        self._zone_model.setStringList(filtered)
-        self._zone_count_label.setText(f"{len(filtered)} zones")
+        if not self._zone_model.set_filter(text):
+            return
+        self._on_zone_selection_changed()
+        self._set_zone_count(self._zone_model.rowCount())
+
+    def _set_zone_count(self, n):
+        # Skip setText (and the label relayout) when the count is unchanged
+        if n == self._last_zone_count:
+            return
+        self._last_zone_count = n
+        self._zone_count_label.setText(f"{n} zone{'s' if n != 1 else ''}")
 
     def select_all_zones(self):
-        sel = self._zone_list.selectionModel()
-        model = self._zone_model
-        sel.select(
-            QtCore.QItemSelection(model.index(0), model.index(model.rowCount() - 1)),
-            QtCore.QItemSelectionModel.SelectionFlag.Select,
-        )
+        self._selection_updating = True
+        try:
+            self._zone_list.selectAll()
+        finally:
+            self._selection_updating = False
+        # Restarts the single relabel timer made in __init__
+        self._on_zone_selection_changed()
 
     def select_no_zones(self):
-        self._zone_list.clearSelection()
+        self._selection_updating = True
+        try:
+            self._zone_list.clearSelection()
+        finally:
+            self._selection_updating = False
+        # Restarts the single relabel timer made in __init__
+        self._on_zone_selection_changed()
 
     def get_selected_zones(self):
-        return [idx.data() for idx in self._zone_list.selectedIndexes()]
+        if self._selected_zones is None:
+            zones = self._zone_model.filtered_zones
+            ranges = self._zone_list.selectionModel().selection()
+            if (ranges.count() == 1 and ranges.at(0).top() == 0
+                    and ranges.at(0).bottom() == len(zones) - 1):
+                # Select All (or one range spanning every row): no need to
+                # materialize an index per row
+                self._selected_zones = tuple(zones)
+            else:
+                self._selected_zones = tuple(
+                    zones[idx.row()] for idx in self._zone_list.selectedIndexes()
+                )
+        return list(self._selected_zones)
+
+    def _on_zone_selection_changed(self, *_):
+        self._selected_zones = None
+        if self._selection_updating:
+            # Bulk change in progress; the caller refreshes once at the end
+            return
+        self._update_export_btn()
 
     def _update_export_btn(self):
-        n = len(self._zone_list.selectedIndexes())
+        # Rubber-band drags emit per row; relabel once the selection settles
+        self._export_btn_timer.start()
+
+    def _apply_export_btn_text(self):
+        # Count from the selection ranges; no per-row index or name lookup
+        ranges = self._zone_list.selectionModel().selection()
+        n = sum(ranges.at(i).height() for i in range(ranges.count()))
         self.export_btn.setText(f"Export ({n})" if n > 0 else "Export")
 
     # ------------------------------------------------------------------
@@ -259,57 +579,49 @@ class ExportInterface(QtWidgets.QWidget):
     # ------------------------------------------------------------------
 
     def browse_export_file(self):
-        selected_format = self.get_selected_export_format()
-        extensions = {
-            'json': 'JSON Files (*.json)',
-            'yaml': 'YAML Files (*.yaml *.yml)',
-            'bind': 'Zone Files (*.zone *.txt)',
-            'djbdns': 'Data Files (*.data *.txt)'
-        }
-        file_filter = extensions.get(selected_format, 'All Files (*)')
-        file_path, _ = QtWidgets.QFileDialog.getSaveFileName(
-            self, "Export Zone File", "", file_filter
+        _open_save_dialog(
+            self, "Export Zone File", "", self._current_export_filter,
+            self.export_file_edit.setText,
         )
-        if file_path:
-            self.export_file_edit.setText(file_path)
+
+    def _set_export_format(self, format_type):
+        self._current_export_format = format_type
+        self._current_export_filter = _FILE_FILTERS[format_type]
 
     def get_selected_export_format(self):
-        for button in self.export_format_group.buttons():
-            if button.isChecked():
-                return button.property('format')
-        return 'json'
+        return self._current_export_format
 
-    def auto_generate_export_filename(self):
-        selected = self.get_selected_zones()
-        if not selected:
-            self.show_error("Please select at least one zone first.")
-            return
-        format_type = self.get_selected_export_format()
+    def _ask_export_path(self, selected, on_selected):
+        """Pick an export path for ``selected`` zones; non-blocking.
+
+        If the output field holds a directory, the generated filename is
+        placed in it directly. Otherwise a save dialog opens, starting in
+        the directory of the last export.
+        """
         if len(selected) == 1:
             filename = self.import_export_manager.generate_export_filename(
-                selected[0], format_type
-            )
-            file_path, _ = QtWidgets.QFileDialog.getSaveFileName(
-                self, "Save Export File", filename,
-                self._get_file_filter(format_type)
+                selected[0], self._current_export_format
             )
+            title, file_filter = "Save Export File", self._current_export_filter
         else:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
             filename = f"bulk_export_{timestamp}.zip"
-            file_path, _ = QtWidgets.QFileDialog.getSaveFileName(
-                self, "Save Bulk Export ZIP", filename, "ZIP files (*.zip)"
-            )
-        if file_path:
-            self.export_file_edit.setText(file_path)
-
-    def _get_file_filter(self, format_type):
-        extensions = {
-            'json': 'JSON Files (*.json)',
-            'yaml': 'YAML Files (*.yaml *.yml)',
-            'bind': 'Zone Files (*.zone *.txt)',
-            'djbdns': 'Data Files (*.data *.txt)'
-        }
-        return extensions.get(format_type, 'All Files (*)')
+            title, file_filter = "Save Bulk Export ZIP", _ZIP_FILE_FILTER
+
+        target_dir = self.export_file_edit.text().strip()
+        if target_dir and os.path.isdir(target_dir):
+            on_selected(os.path.join(target_dir, filename))
+            return
+        if self._last_export_dir:
+            filename = os.path.join(self._last_export_dir, filename)
+        _open_save_dialog(self, title, filename, file_filter, on_selected)
+
+    def auto_generate_export_filename(self):
+        selected = self.get_selected_zones()
+        if not selected:
+            self.show_error("Please select at least one zone first.")
+            return
+        self._ask_export_path(selected, self.export_file_edit.setText)
 
     def start_export(self):
         selected_zones = self.get_selected_zones()
@@ -317,47 +629,38 @@ class ExportInterface(QtWidgets.QWidget):
             self.show_error("Please select at least one zone to export.")
             return
         file_path = self.export_file_edit.text().strip()
-        format_type = self.get_selected_export_format()
+        if not file_path or os.path.isdir(file_path):
+            # Continues in _export_to once a file name is settled
+            self._ask_export_path(selected_zones, self._export_to)
+            return
+        self._export_to(file_path)
+
+    def _export_to(self, file_path):
+        selected_zones = self.get_selected_zones()
+        if not file_path or not selected_zones:
+            return
+        self._last_export_dir = os.path.dirname(file_path)
+        format_type = self._current_export_format
         include_metadata = self.include_metadata_cb.isChecked()
 
         if len(selected_zones) == 1:
-            zone_name = selected_zones[0]
-            if not file_path:
-                filename = self.import_export_manager.generate_export_filename(
-                    zone_name, format_type
-                )
-                file_path, _ = QtWidgets.QFileDialog.getSaveFileName(
-                    self, "Save Export File", filename,
-                    self._get_file_filter(format_type)
-                )
-                if not file_path:
-                    return
-            self.set_operation_running(True)
-            self.worker = ImportExportWorker(
-                self.import_export_manager, 'export',
-                zone_name=zone_name, format_type=format_type,
-                file_path=file_path, include_metadata=include_metadata
+            self._run_operation(
+                'export', self.on_export_finished,
+                zone_name=selected_zones[0], format_type=format_type,
+                file_path=file_path, include_metadata=include_metadata,
+                compress='gzip' if file_path.endswith('.gz') else None,
             )
-            self.worker.finished.connect(self.on_export_finished)
-            self.worker.start()
         else:
-            if not file_path:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"bulk_export_{timestamp}.zip"
-                file_path, _ = QtWidgets.QFileDialog.getSaveFileName(
-                    self, "Save Bulk Export ZIP", filename, "ZIP files (*.zip)"
-                )
-                if not file_path:
-                    return
-            self.set_operation_running(True)
-            self.worker = ImportExportWorker(
-                self.import_export_manager, 'bulk_export',
+            compression, compresslevel = (
+                self.zip_compression_group.checkedButton()._zip_preset
+            )
+            self._run_operation(
+                'bulk_export', self.on_export_finished,
                 zone_names=selected_zones, format_type=format_type,
-                file_path=file_path, include_metadata=include_metadata
+                file_path=file_path, include_metadata=include_metadata,
+                compression=compression, compresslevel=compresslevel,
+                update_existing=self.update_archive_cb.isChecked(),
             )
-            self.worker.finished.connect(self.on_export_finished)
-            self.worker.progress_update.connect(self.on_progress_update)
-            self.worker.start()
 
     def on_export_finished(self, success, message, data):
         self.set_operation_running(False)
@@ -366,19 +669,37 @@ class ExportInterface(QtWidgets.QWidget):
         else:
             self.show_error(f"Export failed:\n{message}")
 
-    def on_progress_update(self, percentage, status):
+    def _flush_progress(self):
+        # Polls the worker's latest progress at most ~60x/s
+        if self.worker is None:
+            return
+        pending = self.worker.progress_state
+        if pending is None or pending == self._shown_progress:
+            return
+        self._shown_progress = pending
+        percentage, status = pending
         self.progress_bar.setValue(percentage)
-        self.status_label.setText(f"{percentage}% \u2014 {status}")
+        _set_status_text(self.status_label, _format_progress(percentage, status))
 
     def set_operation_running(self, running):
-        self.progress_bar.setVisible(running)
-        if running:
-            self.progress_bar.setRange(0, 100)
-            self.progress_bar.setValue(0)
-            self.status_label.setText("Starting...")
-        self.export_btn.setEnabled(not running)
-        if not running:
-            self.status_label.clear()
+        # Coalesce the widget changes below into a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            self.progress_bar.setVisible(running)
+            self._shown_progress = None
+            if running:
+                self.progress_bar.setRange(0, 100)
+                self.progress_bar.setValue(0)
+                self.status_label.setText("Starting...")
+                self._progress_timer.start()
+            else:
+                self._progress_timer.stop()
+            self.export_btn.setEnabled(not running)
+            if not running:
+                self.status_label.clear()
+                self.status_label.setToolTip("")
+        finally:
+            self.setUpdatesEnabled(True)
 
     def show_success(self, message):
         InfoBar.success(
@@ -416,9 +737,32 @@ class ImportInterface(QtWidgets.QWidget):
         self.setObjectName("importInterface")
         self.import_export_manager = import_export_manager
         self.available_zones = available_zones or []
+        self.pool = QThreadPool.globalInstance()
         self.worker = None
-        self.setup_ui()
-        self._confirm_drawer = ConfirmDrawer(parent=self)
+        self._finished_handler = None
+        self._shown_progress = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(16)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        self._current_import_format = 'json'
+        self._current_import_mode = 'append'
+        self._has_path = False
+        # Collapses bursts of textChanged (typing, paste) into one update
+        self._file_change_timer = QTimer(self)
+        self._file_change_timer.setSingleShot(True)
+        self._file_change_timer.setInterval(100)
+        self._file_change_timer.timeout.connect(self._apply_import_file_change)
+        # (path, mtime_ns, size, format, target, mode) -> (message, data)
+        self._preview_cache = OrderedDict()
+        self._shown_preview_text = None
+        # (file signature, target_zone, mode) of imports completed this
+        # session -> the zone's 'touched' time right after each one
+        self._applied_imports = {}
+        # Arguments of the last import, to re-run it when it was skipped
+        self._last_import_kwargs = None
+        # Widgets are built on first show so startup doesn't pay for them
+        self._ui_built = False
+        self._applied_qss = None
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
@@ -426,16 +770,58 @@ class ImportInterface(QtWidgets.QWidget):
             self._confirm_drawer.reposition(event.size())
 
     def showEvent(self, event):
+        if not self._ui_built:
+            # Build the whole tree before the first paint/layout pass
+            self.setUpdatesEnabled(False)
+            try:
+                self.setup_ui()
+                self._confirm_drawer = ConfirmDrawer(parent=self)
+            finally:
+                self.setUpdatesEnabled(True)
+            self._ui_built = True
         super().showEvent(event)
-        self.setStyleSheet(container_qss())
+        # Re-polishing the subtree is costly; only redo it after a theme change
+        qss = container_qss()
+        if qss != self._applied_qss:
+            self._applied_qss = qss
+            self.setStyleSheet(qss)
         self.zones_refresh_requested.emit()
 
     def hideEvent(self, event):
-        if self.worker and self.worker.isRunning():
-            self.worker.terminate()
-            self.worker.wait()
+        if self.worker is not None:
+            # Cooperative: the finished handler resets the UI once it stops
+            self.worker.cancel()
         super().hideEvent(event)
 
+    def stop_worker(self):
+        """Cancel any running operation (call on application shutdown)."""
+        if self.worker is not None:
+            # Detach first so nothing queued lands on a closing page
+            self.worker.signals.finished.disconnect(self._on_worker_finished)
+            self.worker.cancel()
+            self.worker = None
+
+    def _run_operation(self, operation, on_finished, **kwargs):
+        if self.worker is not None:
+            # Ignore repeated clicks while an operation is in flight
+            return
+        self._finished_handler = on_finished
+        self.set_operation_running(True)
+        self.worker = ImportExportWorker(
+            self.import_export_manager, operation, **kwargs
+        )
+        self.worker.signals.finished.connect(
+            self._on_worker_finished, Qt.ConnectionType.QueuedConnection
+        )
+        self.pool.start(self.worker)
+
+    def _on_worker_finished(self, success, message, data):
+        self.worker = None
+        handler, self._finished_handler = self._finished_handler, None
+        if handler is None:
+            return
+        handler(success, message, data)
+
     def setup_ui(self):
         outer = QtWidgets.QVBoxLayout(self)
         outer.setContentsMargins(0, 0, 0, 0)
@@ -468,8 +854,11 @@ class ImportInterface(QtWidgets.QWidget):
 
         # Preview area
         left_lay.addWidget(CaptionLabel("Preview (read-only):"))
-        self.preview_text = TextEdit()
+        # Plain-text document: no rich-text layout, no undo history
+        self.preview_text = PlainTextEdit()
         self.preview_text.setReadOnly(True)
+        self.preview_text.setUndoRedoEnabled(False)
+        self.preview_text.setFont(QtGui.QFont("Monospace", 9))
         self.preview_text.setPlaceholderText(
             "Select a file and click Preview to see import data..."
         )
@@ -498,14 +887,9 @@ class ImportInterface(QtWidgets.QWidget):
         format_group = QtWidgets.QGroupBox("Format")
         format_layout = QtWidgets.QVBoxLayout(format_group)
         self.import_format_group = QtWidgets.QButtonGroup()
-        formats = ImportExportManager.SUPPORTED_FORMATS
-        for fmt_key, fmt_desc in formats.items():
-            radio = QtWidgets.QRadioButton(fmt_desc)
-            radio.setProperty('format', fmt_key)
-            self.import_format_group.addButton(radio)
-            format_layout.addWidget(radio)
-            if fmt_key == 'json':
-                radio.setChecked(True)
+        self._import_format_radios = _build_format_radios(
+            format_layout, self.import_format_group, self._set_import_format
+        )
         right_lay.addWidget(format_group)
 
         # Target zone
@@ -513,8 +897,10 @@ class ImportInterface(QtWidgets.QWidget):
         target_layout = QtWidgets.QVBoxLayout(target_group)
         self.target_zone_combo = QtWidgets.QComboBox()
         self.target_zone_combo.setEditable(True)
-        self.target_zone_combo.addItem("[Use zone name from file]", "")
-        self.target_zone_combo.addItems(self.available_zones)
+        self._target_zone_model = QtCore.QStringListModel(
+            [_USE_FILE_ZONE] + self.available_zones, self
+        )
+        self.target_zone_combo.setModel(self._target_zone_model)
         target_layout.addWidget(self.target_zone_combo)
         target_help = QtWidgets.QLabel(
             "Select an existing zone or enter a new zone name. "
@@ -547,6 +933,15 @@ class ImportInterface(QtWidgets.QWidget):
         )
         self.existing_records_group.addButton(self.replace_existing_radio)
         existing_layout.addWidget(self.replace_existing_radio)
+
+        for radio, mode in (
+            (self.append_existing_radio, 'append'),
+            (self.merge_existing_radio, 'merge'),
+            (self.replace_existing_radio, 'replace'),
+        ):
+            radio.toggled.connect(
+                lambda checked, m=mode: checked and self._set_existing_records_mode(m)
+            )
         right_lay.addWidget(existing_group)
 
         right_lay.addStretch()
@@ -578,117 +973,171 @@ class ImportInterface(QtWidgets.QWidget):
     # ------------------------------------------------------------------
 
     def update_zones(self, available_zones):
-        self.available_zones = available_zones or []
-        current = self.target_zone_combo.currentText()
-        self.target_zone_combo.clear()
-        self.target_zone_combo.addItem("[Use zone name from file]", "")
-        self.target_zone_combo.addItems(self.available_zones)
-        if current:
-            idx = self.target_zone_combo.findText(current)
-            if idx >= 0:
-                self.target_zone_combo.setCurrentIndex(idx)
+        available_zones = available_zones or []
+        if available_zones == self.available_zones:
+            return
+        self.available_zones = available_zones
+        if not self._ui_built:
+            return
+        combo = self.target_zone_combo
+        current = combo.currentText()
+        # The reset and restore below would otherwise emit index/text
+        # changes twice and repaint the combo in between
+        combo.blockSignals(True)
+        combo.setUpdatesEnabled(False)
+        try:
+            self._target_zone_model.setStringList(
+                [_USE_FILE_ZONE] + self.available_zones
+            )
+            if current:
+                idx = combo.findText(current)
+                if idx >= 0:
+                    combo.setCurrentIndex(idx)
+                else:
+                    # Keep a typed zone name that is not in the list (yet)
+                    combo.setEditText(current)
+        finally:
+            combo.setUpdatesEnabled(True)
+            combo.blockSignals(False)
 
     # ------------------------------------------------------------------
     # Import logic (unchanged)
     # ------------------------------------------------------------------
 
     def browse_import_file(self):
-        file_path, _ = QtWidgets.QFileDialog.getOpenFileName(
-            self, "Import Zone File", "",
-            "All Supported (*.json *.yaml *.yml *.zone *.data *.txt);;"
-            "JSON Files (*.json);;YAML Files (*.yaml *.yml);;"
-            "Zone Files (*.zone *.txt);;Data Files (*.data *.txt);;"
-            "All Files (*)"
-        )
-        if file_path:
-            self.import_file_edit.setText(file_path)
+        dlg = QtWidgets.QFileDialog(self, "Import Zone File", "", _IMPORT_FILE_FILTER)
+        dlg.setOptions(_FILE_DIALOG_OPTIONS)
+        dlg.setFileMode(QtWidgets.QFileDialog.FileMode.ExistingFile)
+        dlg.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dlg.fileSelected.connect(self.import_file_edit.setText)
+        dlg.open()
+
+    def _set_import_format(self, format_type):
+        self._current_import_format = format_type
 
     def get_selected_import_format(self):
-        for button in self.import_format_group.buttons():
-            if button.isChecked():
-                return button.property('format')
-        return 'json'
+        return self._current_import_format
 
     def get_target_zone(self):
-        current_text = self.target_zone_combo.currentText().strip()
-        if current_text == "[Use zone name from file]" or not current_text:
+        # Typed text does not move the index off row 0 until committed, so
+        # the placeholder check still needs the text, but only on that row
+        text = self.target_zone_combo.currentText().strip()
+        if not text or (
+            self.target_zone_combo.currentIndex() == 0 and text == _USE_FILE_ZONE
+        ):
             return None
-        return current_text
+        return text
+
+    def _set_existing_records_mode(self, mode):
+        self._current_import_mode = mode
 
     def get_existing_records_mode(self):
-        if self.merge_existing_radio.isChecked():
-            return 'merge'
-        elif self.replace_existing_radio.isChecked():
-            return 'replace'
-        return 'append'
-
-    def on_import_file_changed(self):
-        has_file = bool(self.import_file_edit.text().strip())
-        self.preview_btn.setEnabled(has_file)
-        self.import_btn.setEnabled(has_file)
-        if not has_file:
+        return self._current_import_mode
+
+    def on_import_file_changed(self, text):
+        # Restarts the debounce; _apply_import_file_change runs once it settles
+        self._file_change_timer.start()
+
+    def _apply_import_file_change(self):
+        text = self.import_file_edit.text()
+        has_file = bool(text) and not text.isspace()
+        if has_file == self._has_path:
+            # Buttons and preview already reflect this state
+            return
+        self._has_path = has_file
+        enabled = has_file and self.worker is None
+        self.preview_btn.setEnabled(enabled)
+        self.import_btn.setEnabled(enabled)
+        if not has_file and not self.preview_text.document().isEmpty():
             self.preview_text.clear()
+            self._shown_preview_text = None
 
     def preview_import(self):
         file_path = self.import_file_edit.text().strip()
         if not file_path:
             return
-        format_type = self.get_selected_import_format()
+        format_type = self._current_import_format
         target_zone = self.get_target_zone()
         existing_records_mode = self.get_existing_records_mode()
-        self.set_operation_running(True)
-        self.worker = ImportExportWorker(
-            self.import_export_manager, 'import',
+
+        key = self._preview_cache_key(
+            file_path, format_type, target_zone, existing_records_mode
+        )
+        cached = self._preview_cache.get(key)
+        if cached is not None:
+            self._preview_cache.move_to_end(key)
+            self.on_preview_finished(True, *cached)
+            return
+
+        def _on_finished(success, message, data):
+            if success and data and key is not None:
+                self._preview_cache[key] = (message, data)
+                if len(self._preview_cache) > PREVIEW_CACHE_SIZE:
+                    self._preview_cache.popitem(last=False)
+            self.on_preview_finished(success, message, data)
+
+        self._run_operation(
+            'import', _on_finished,
             file_path=file_path, format_type=format_type,
             dry_run=True, target_zone=target_zone,
-            existing_records_mode=existing_records_mode
+            existing_records_mode=existing_records_mode,
+            preview_limit=PREVIEW_RECORD_LIMIT,
         )
-        self.worker.finished.connect(self.on_preview_finished)
-        self.worker.start()
+
+    def _preview_cache_key(self, file_path, format_type, target_zone, mode):
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        return (file_path, st.st_mtime_ns, st.st_size, format_type, target_zone, mode)
 
     def start_import(self):
         file_path = self.import_file_edit.text().strip()
         if not file_path:
             self.show_error("Please select a file to import.")
             return
-        format_type = self.get_selected_import_format()
+        format_type = self._current_import_format
         target_zone = self.get_target_zone()
         existing_records_mode = self.get_existing_records_mode()
 
-        items = []
-        if target_zone:
-            items.append(f"Target zone: {target_zone}")
-        else:
-            items.append("Zone name: from import file")
-        mode_labels = {
-            'replace': "Replace (delete existing records first)",
-            'merge': "Merge (update matching records)",
-        }
-        items.append(f"Mode: {mode_labels.get(existing_records_mode, 'Append (keep existing)')}")
-
-        # Capture locals for callback
-        _fp, _ft, _tz, _erm = file_path, format_type, target_zone, existing_records_mode
-
-        def _do_import():
-            self.set_operation_running(True)
-            self.worker = ImportExportWorker(
-                self.import_export_manager, 'import',
-                file_path=_fp, format_type=_ft,
-                dry_run=False, target_zone=_tz,
-                existing_records_mode=_erm,
-            )
-            self.worker.finished.connect(self.on_import_finished)
-            self.worker.progress_update.connect(self.on_progress_update)
-            self.worker.start()
+        items = [
+            f"Target zone: {target_zone}" if target_zone
+            else "Zone name: from import file",
+            f"Mode: {_IMPORT_MODE_LABELS.get(existing_records_mode, _IMPORT_MODE_LABELS['append'])}",
+        ]
+
+        # Reuse a complete (untruncated) preview parse of the same file
+        cached = self._preview_cache.get(self._preview_cache_key(
+            file_path, format_type, target_zone, existing_records_mode
+        ))
+        prepared_data = None
+        if cached is not None and not cached[1].get('truncated'):
+            prepared_data = cached[1]
+
+        import_kwargs = dict(
+            file_path=file_path, format_type=format_type,
+            dry_run=False, target_zone=target_zone,
+            existing_records_mode=existing_records_mode,
+            prepared_data=prepared_data,
+        )
 
         self._confirm_drawer.ask(
             title="Confirm Import",
             message="Import records from file? This cannot be undone.",
             items=items,
-            on_confirm=_do_import,
+            on_confirm=lambda: self._run_import(import_kwargs),
             confirm_text="Import",
         )
 
+    def _run_import(self, import_kwargs, force=False):
+        self._last_import_kwargs = import_kwargs
+        self._run_operation(
+            'import', self.on_import_finished,
+            applied_imports=dict(self._applied_imports),
+            force=force,
+            **import_kwargs,
+        )
+
     def on_preview_finished(self, success, message, data):
         self.set_operation_running(False)
         if success and data:
@@ -699,61 +1148,95 @@ class ImportInterface(QtWidgets.QWidget):
             )
             existing_records_mode = data.get('existing_records_mode', 'ignore')
 
-            preview_text = f"Target Zone: {target_zone}\n"
-            preview_text += f"Records: {len(records)}\n"
-            preview_text += f"Existing Records: {existing_records_mode.title()}\n"
+            record_count = data.get('record_count', len(records))
+            parts = [f"Target Zone: {target_zone}"]
+            if data.get('truncated'):
+                parts.append(f"Records: ~{record_count} (truncated preview)")
+            else:
+                parts.append(f"Records: {record_count}")
+            parts.append(f"Existing Records: {existing_records_mode.title()}")
 
             original_zone = zone_info.get('name', 'Unknown')
             if target_zone != original_zone:
-                preview_text += f"Original Zone (from file): {original_zone}\n"
+                parts.append(f"Original Zone (from file): {original_zone}")
 
             if existing_records_mode == 'replace':
-                preview_text += "Will delete all existing records first\n"
+                parts.append("Will delete all existing records first")
             elif existing_records_mode == 'merge':
-                preview_text += "Will update matching records only\n"
+                parts.append("Will update matching records only")
             else:
-                preview_text += "Will preserve existing records\n"
-
-            preview_text += "\n"
-            for i, record in enumerate(records[:10]):
-                subname = record.get('subname', '@')
-                rtype = record.get('type', 'Unknown')
-                content = ', '.join(record.get('records', []))
-                preview_text += f"{subname:<15} {rtype:<8} {content}\n"
-            if len(records) > 10:
-                preview_text += f"\n... and {len(records) - 10} more records"
-
-            self.preview_text.setPlainText(preview_text)
-            self.status_label.setText(f"Preview: {message}")
+                parts.append("Will preserve existing records")
+
+            parts.append("")
+            parts.extend(_format_preview_record(r) for r in records[:10])
+            if record_count > 10:
+                parts.append(f"\n... and {record_count - 10} more records")
+
+            text = "\n".join(parts)
+            if text != self._shown_preview_text:
+                # Re-previewing unchanged input keeps the current document
+                self._shown_preview_text = text
+                self.preview_text.setPlainText(text)
+            _set_status_text(self.status_label, f"Preview: {message}")
         else:
             self.show_error(f"Preview failed:\n{message}")
 
     def on_import_finished(self, success, message, data):
         self.set_operation_running(False)
+        if success and data and data.get('skipped'):
+            # Nothing was sent; let the user push the file again anyway
+            _set_status_text(self.status_label, message)
+            import_kwargs = self._last_import_kwargs
+            self._confirm_drawer.ask(
+                title="Import Skipped",
+                message=f"{message}.\nImport the file again anyway?",
+                on_confirm=lambda: self._run_import(import_kwargs, force=True),
+                confirm_text="Import Anyway",
+            )
+            return
         if success:
+            if data and data.get('zone_touched'):
+                self._applied_imports[data['import_key']] = data['zone_touched']
+            # Previews describe the zone as it was before this import
+            self._preview_cache.clear()
             self.show_success(f"Import completed successfully!\n{message}")
             self.import_completed.emit()
         else:
             self.show_error(f"Import failed:\n{message}")
 
-    def on_progress_update(self, percentage, status):
+    def _flush_progress(self):
+        # Polls the worker's latest progress at most ~60x/s
+        if self.worker is None:
+            return
+        pending = self.worker.progress_state
+        if pending is None or pending == self._shown_progress:
+            return
+        self._shown_progress = pending
+        percentage, status = pending
         self.progress_bar.setValue(percentage)
-        self.status_label.setText(f"{percentage}% \u2014 {status}")
+        _set_status_text(self.status_label, _format_progress(percentage, status))
 
     def set_operation_running(self, running):
-        self.progress_bar.setVisible(running)
-        if running:
-            self.progress_bar.setRange(0, 100)
-            self.progress_bar.setValue(0)
-            self.status_label.setText("Starting...")
-        self.import_btn.setEnabled(
-            not running and bool(self.import_file_edit.text().strip())
-        )
-        self.preview_btn.setEnabled(
-            not running and bool(self.import_file_edit.text().strip())
-        )
-        if not running:
-            self.status_label.clear()
+        # Coalesce the widget changes below into a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            self.progress_bar.setVisible(running)
+            self._shown_progress = None
+            if running:
+                self.progress_bar.setRange(0, 100)
+                self.progress_bar.setValue(0)
+                self.status_label.setText("Starting...")
+                self._progress_timer.start()
+            else:
+                self._progress_timer.stop()
+            enabled = not running and self._has_path
+            self.import_btn.setEnabled(enabled)
+            self.preview_btn.setEnabled(enabled)
+            if not running:
+                self.status_label.clear()
+                self.status_label.setToolTip("")
+        finally:
+            self.setUpdatesEnabled(True)
 
     def show_success(self, message):
         InfoBar.success(
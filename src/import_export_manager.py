@@ -6,18 +6,62 @@ Import/Export Manager for DNS zones and records.
 Supports multiple formats: JSON, YAML, BIND zone files, djbdns/tinydns.
 """
 
+import gzip
+import io
 import json
+import operator
 import yaml
 import os
 import re
-import zipfile
 import tempfile
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple
+from itertools import islice
+from sys import intern
+from typing import Collection, Dict, Iterable, List, Any, Mapping, Optional, Tuple
 import logging
 
+from api_client import RateLimitResponse
+
 logger = logging.getLogger(__name__)
 
+
+class OperationCancelled(Exception):
+    """Raised from a progress callback to abandon the running operation."""
+
+
+# orjson is an optional, much faster drop-in for the JSON hot paths
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# BIND record line: owner, optional TTL and IN class (either order), type, data
+_BIND_RECORD_RE = re.compile(
+    r'(\S+)\s+(?:(\d+)\s+)?(?:IN\s+)?(?:(\d+)\s+)?(?!IN\s)([A-Z][A-Z0-9]{0,5})\s+(.+)'
+)
+
+# Tokens of BIND record data: quoted strings (kept verbatim) or bare words
+_BIND_DATA_TOKEN_RE = re.compile(r'"(?:[^"\\]|\\.)*"?|[^\s"]+')
+
+# Use the libyaml-backed loader/dumper when PyYAML was built with it
+_YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YamlDumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps_indented(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+else:
+    _json_loads = json.loads
+
+    def _json_dumps_indented(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
 class ImportExportManager:
     """Manages import and export of DNS zones and records in various formats."""
     
@@ -28,6 +72,43 @@ class ImportExportManager:
         'djbdns': 'djbdns/tinydns Format'
     }
     
+    # File extensions used for generated export filenames
+    FORMAT_EXTENSIONS = {
+        'json': 'json',
+        'yaml': 'yaml',
+        'bind': 'zone',
+        'djbdns': 'data'
+    }
+    
+    # tinydns-data line prefixes for types written as prefix+fqdn:content:ttl
+    DJBDNS_PREFIXES = {
+        'A': '+',
+        'AAAA': '6',
+        'CNAME': 'C',
+        'TXT': "'"
+    }
+    
+    # Zones fetched/serialized concurrently during a bulk export
+    BULK_EXPORT_WORKERS = 4
+    
+    # RRsets sent per bulk API request while applying an import
+    RECORD_BATCH_SIZE = 500
+    
+    # Retries of a rate-limited (429) bulk request before its batch fails;
+    # longer waits than the cap (daily limits) fail the batch at once
+    BULK_RATE_LIMIT_RETRIES = 3
+    BULK_RATE_LIMIT_MAX_WAIT = 60
+    
+    # Single-RRset API calls in flight when a rejected batch is retried;
+    # the API client's rate limiter still spaces the requests themselves
+    IMPORT_API_WORKERS = 8
+    
+    # ZIP member compression for bulk exports
+    ZIP_COMPRESSION = {
+        'stored': zipfile.ZIP_STORED,
+        'deflate': zipfile.ZIP_DEFLATED
+    }
+    
     def __init__(self, api_client, cache_manager):
         """Initialize the import/export manager.
         
@@ -49,24 +130,170 @@ class ImportExportManager:
             Generated filename with timestamp
         """
         # Get current timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         
         # Clean zone name for filename (replace dots with underscores)
         clean_zone_name = zone_name.replace('.', '_')
         
-        # File extensions based on format
-        extensions = {
-            'json': 'json',
-            'yaml': 'yaml', 
-            'bind': 'zone',
-            'djbdns': 'data'
-        }
-        
-        extension = extensions.get(format_type, 'txt')
+        extension = self.FORMAT_EXTENSIONS.get(format_type, 'txt')
         
         return f"{clean_zone_name}_export_{timestamp}.{extension}"
     
-    def _delete_all_zone_records(self, zone_name: str) -> Tuple[bool, str]:
+    def file_signature(self, file_path: str) -> Tuple[str, int, int]:
+        """Identify a version of a file by absolute path, size and mtime.
+        
+        A stat call, unlike hashing the whole file on every import.
+        """
+        st = os.stat(file_path)
+        return os.path.abspath(file_path), st.st_size, st.st_mtime_ns
+    
+    def _zone_touched(self, zone_name: str) -> Optional[str]:
+        """Server-side time of the zone's last record change, or None."""
+        success, result = self.api_client.get_zone(zone_name)
+        if success and isinstance(result, dict):
+            return result.get('touched')
+        return None
+    
+    def _run_record_calls(self, calls: List[Tuple]) -> List[Tuple[Any, bool, Any]]:
+        """Issue per-record API calls on a thread pool.
+        
+        The calls are network-bound, so overlapping them hides most of the
+        round-trip latency.
+        
+        Args:
+            calls: (tag, callable, args) tuples; the tag is handed back
+            
+        Returns:
+            List of (tag, success, result) tuples in completion order
+        """
+        results = []
+        total_calls = len(calls)
+        if not total_calls:
+            return results
+        
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.IMPORT_API_WORKERS, total_calls),
+            thread_name_prefix="zone-import",
+        )
+        try:
+            futures = {executor.submit(func, *args): tag for tag, func, args in calls}
+            for future in as_completed(futures):
+                success, result = future.result()
+                results.append((futures[future], success, result))
+        finally:
+            # Drop queued calls if we are unwinding early (e.g. cancelled)
+            executor.shutdown(wait=True, cancel_futures=True)
+        return results
+    
+    def _apply_rrset_batch(self, zone_name: str, action: str,
+                           batch: List[Dict]) -> List[Tuple[Any, bool, Any]]:
+        """Send one batch of RRset changes through the bulk rrsets endpoint.
+        
+        deSEC applies a bulk request atomically, so when a batch fails
+        validation (400 with per-RRset errors) its RRsets are retried one by
+        one; only the bad entries then fail instead of the whole batch. A
+        rate-limited batch is retried after the server's Retry-After wait;
+        any other error fails the whole batch.
+        
+        Args:
+            zone_name: Name of the zone
+            action: 'create', 'update' or 'delete'
+            batch: Records to apply
+            
+        Returns:
+            List of ((action, record), success, result) tuples
+        """
+        if action == 'delete':
+            payload = [{'subname': r.get('subname', ''), 'type': r.get('type'), 'records': []}
+                       for r in batch]
+        else:
+            payload = [{'subname': r['subname'], 'type': r['type'],
+                        'ttl': r['ttl'], 'records': r['records']}
+                       for r in batch]
+        bulk_call = (self.api_client.bulk_create_records if action == 'create'
+                     else self.api_client.bulk_update_records)
+        
+        retries = 0
+        while True:
+            success, result = bulk_call(zone_name, payload)
+            if success:
+                return [((action, record), True, result) for record in batch]
+            if not isinstance(result, RateLimitResponse):
+                break
+            if (result.retry_after > self.BULK_RATE_LIMIT_MAX_WAIT
+                    or retries >= self.BULK_RATE_LIMIT_RETRIES):
+                result = f"Rate limited: {result.message}"
+                break
+            retries += 1
+            wait = result.retry_after + 0.5  # small buffer
+            logger.warning(f"Bulk {action} rate limited, retry {retries}/"
+                           f"{self.BULK_RATE_LIMIT_RETRIES} after {wait:.1f}s")
+            time.sleep(wait)
+        
+        # Only a validation rejection carries per-RRset errors worth isolating;
+        # transport, auth or server errors would fail each single call too
+        if not (isinstance(result, dict) and result.get('status_code') == 400
+                and isinstance(result.get('raw_response'), list)):
+            logger.warning(f"Bulk {action} of {len(batch)} records failed: {result}")
+            return [((action, record), False, result) for record in batch]
+        
+        logger.warning(f"Bulk {action} of {len(batch)} records rejected, retrying individually: {result}")
+        if action == 'delete':
+            calls = [((action, record), self.api_client.delete_record,
+                      (zone_name, rrset['subname'], rrset['type']))
+                     for record, rrset in zip(batch, payload)]
+        else:
+            func = (self.api_client.create_record if action == 'create'
+                    else self.api_client.update_record)
+            calls = [((action, record), func,
+                      (zone_name, rrset['subname'], rrset['type'], rrset['ttl'], rrset['records']))
+                     for record, rrset in zip(batch, payload)]
+        return self._run_record_calls(calls)
+    
+    def _check_cancelled(self, cancel_check) -> None:
+        """Raise OperationCancelled if ``cancel_check`` reports a cancel request.
+        
+        Called only at loop and batch boundaries, before the next side
+        effect, so work that already completed is never reported as
+        cancelled.
+        """
+        if cancel_check is not None and cancel_check():
+            raise OperationCancelled()
+    
+    def _apply_rrset_changes(self, zone_name: str, changes: List[Tuple[str, Dict]],
+                             progress_callback=None,
+                             verb: str = "Processed",
+                             cancel_check=None) -> List[Tuple[Any, bool, Any]]:
+        """Apply (action, record) changes in RECORD_BATCH_SIZE bulk requests.
+        
+        Args:
+            zone_name: Name of the zone
+            changes: (action, record) pairs, action being 'create',
+                'update' or 'delete'
+            progress_callback: Optional callback, driven over the 40-90% range
+            verb: Progress text prefix, e.g. "Created"
+            cancel_check: Optional callable; when it returns True,
+                OperationCancelled is raised before the next batch
+            
+        Returns:
+            List of ((action, record), success, result) tuples
+        """
+        results = []
+        total_records = len(changes)
+        done = 0
+        for action in ('delete', 'update', 'create'):
+            records = [record for change, record in changes if change == action]
+            for start in range(0, len(records), self.RECORD_BATCH_SIZE):
+                batch = records[start:start + self.RECORD_BATCH_SIZE]
+                self._check_cancelled(cancel_check)
+                results.extend(self._apply_rrset_batch(zone_name, action, batch))
+                done += len(batch)
+                if progress_callback:
+                    progress_percent = 40 + int(done / total_records * 50)  # 40-90% range
+                    progress_callback(progress_percent, f"{verb} {done}/{total_records} records...")
+        return results
+    
+    def _delete_all_zone_records(self, zone_name: str, cancel_check=None) -> Tuple[bool, str]:
         """Delete all records from a zone (for overwrite mode).
         
         Args:
@@ -84,18 +311,14 @@ class ImportExportManager:
             deleted_count = 0
             failed_count = 0
             
-            # Delete each record
-            for record in existing_records:
-                # Skip NS and SOA records as they are required for the zone
-                if record.get('type') in ['NS', 'SOA']:
-                    continue
-                
-                success, result = self.api_client.delete_record(
-                    zone_name,
-                    record.get('subname', ''),
-                    record.get('type')
-                )
-                
+            # Delete every record, skipping NS and SOA records as they are
+            # required for the zone
+            changes = [
+                ('delete', record) for record in existing_records
+                if record.get('type') not in ['NS', 'SOA']
+            ]
+            for (_, record), success, result in self._apply_rrset_changes(
+                    zone_name, changes, cancel_check=cancel_check):
                 if success:
                     deleted_count += 1
                 else:
@@ -108,11 +331,14 @@ class ImportExportManager:
             
             return True, message
             
+        except OperationCancelled:
+            raise
         except Exception as e:
             logger.error(f"Failed to clear zone records: {e}")
             return False, f"Failed to clear zone records: {str(e)}"
     
-    def _overwrite_matching_records(self, zone_name: str, import_records: List[Dict], progress_callback=None) -> Tuple[int, int, int]:
+    def _overwrite_matching_records(self, zone_name: str, import_records: List[Dict], progress_callback=None,
+                                    cancel_check=None) -> Tuple[int, int, int]:
         """Overwrite only records that exist in both the zone and import file.
         
         Args:
@@ -130,63 +356,41 @@ class ImportExportManager:
                 return 0, 0, len(import_records)
             
             # Create a set of existing record keys (subname, type) for fast lookup
-            existing_keys = set()
-            for record in existing_records:
-                key = (record.get('subname', ''), record.get('type', ''))
-                existing_keys.add(key)
+            existing_keys = {(r.get('subname', ''), r.get('type', '')) for r in existing_records}
             
             created_count = 0
             updated_count = 0
             failed_count = 0
-            total_records = len(import_records)
             
-            for i, record in enumerate(import_records):
-                record_key = (record.get('subname', ''), record.get('type', ''))
-                
-                if record_key in existing_keys:
-                    # Record exists - update it
-                    success, result = self.api_client.update_record(
-                        zone_name,
-                        record['subname'],
-                        record['type'],
-                        record['ttl'],
-                        record['records']
-                    )
-                    
-                    if success:
-                        updated_count += 1
-                    else:
-                        failed_count += 1
-                        logger.warning(f"Failed to update record {record}: {result}")
+            # Update records that exist, create the rest; parsed import
+            # records always carry subname and type
+            changes = [
+                ('update' if (r['subname'], r['type']) in existing_keys else 'create', r)
+                for r in import_records
+            ]
+            
+            results = self._apply_rrset_changes(zone_name, changes, progress_callback, "Processed",
+                                                 cancel_check)
+            for (action, record), success, result in results:
+                if not success:
+                    failed_count += 1
+                    logger.warning(f"Failed to {action} record {record}: {result}")
+                elif action == 'update':
+                    updated_count += 1
                 else:
-                    # Record doesn't exist - create it
-                    success, result = self.api_client.create_record(
-                        zone_name,
-                        record['subname'],
-                        record['type'],
-                        record['ttl'],
-                        record['records']
-                    )
-                    
-                    if success:
-                        created_count += 1
-                    else:
-                        failed_count += 1
-                        logger.warning(f"Failed to create record {record}: {result}")
-                
-                # Report progress for each record processed in merge mode
-                if progress_callback and total_records > 0:
-                    progress_percent = 40 + int((i + 1) / total_records * 50)  # 40-90% range
-                    progress_callback(progress_percent, f"Processed {i + 1}/{total_records} records...")
+                    created_count += 1
             
             return created_count, updated_count, failed_count
             
+        except OperationCancelled:
+            raise
         except Exception as e:
             logger.error(f"Failed to overwrite matching records: {e}")
             return 0, 0, len(import_records)
     
     def export_zone(self, zone_name: str, format_type: str, file_path: str, 
-                   include_metadata: bool = True) -> Tuple[bool, str]:
+                   include_metadata: bool = True,
+                   compress: Optional[str] = None) -> Tuple[bool, str]:
         """Export a zone to file in specified format.
         
         Args:
@@ -194,6 +398,7 @@ class ImportExportManager:
             format_type: Export format ('json', 'yaml', 'bind', 'djbdns')
             file_path: Output file path
             include_metadata: Include timestamps and metadata
+            compress: 'gzip' to gzip the output file, None for plain text
             
         Returns:
             Tuple of (success, message)
@@ -216,13 +421,13 @@ class ImportExportManager:
             
             # Export based on format
             if format_type == 'json':
-                return self._export_json(zone_data, records, file_path, include_metadata)
+                return self._export_json(zone_data, records, file_path, include_metadata, compress)
             elif format_type == 'yaml':
-                return self._export_yaml(zone_data, records, file_path, include_metadata)
+                return self._export_yaml(zone_data, records, file_path, include_metadata, compress)
             elif format_type == 'bind':
-                return self._export_bind(zone_data, records, file_path)
+                return self._export_bind(zone_data, records, file_path, compress)
             elif format_type == 'djbdns':
-                return self._export_djbdns(zone_data, records, file_path)
+                return self._export_djbdns(zone_data, records, file_path, compress)
             else:
                 return False, f"Unsupported format: {format_type}"
                 
@@ -233,7 +438,12 @@ class ImportExportManager:
     def import_zone(self, file_path: str, format_type: str, 
                    dry_run: bool = False, target_zone: str = None, 
                    existing_records_mode: str = 'ignore', 
-                   progress_callback=None) -> Tuple[bool, str, Optional[Dict]]:
+                   progress_callback=None,
+                   preview_limit: Optional[int] = None,
+                   prepared_data: Optional[Dict] = None,
+                   applied_imports: Optional[Mapping[Tuple, str]] = None,
+                   cancel_check=None,
+                   force: bool = False) -> Tuple[bool, str, Optional[Dict]]:
         """Import a zone from file.
         
         Args:
@@ -242,9 +452,23 @@ class ImportExportManager:
             dry_run: If True, validate only without creating records
             target_zone: Override zone name (if None, use zone name from file)
             existing_records_mode: How to handle existing records ('append', 'merge', or 'replace')
+            preview_limit: With dry_run, stop parsing a BIND or djbdns file
+                after this many records and report an approximate total;
+                JSON and YAML files are always read whole
+            prepared_data: Complete preview data from an earlier dry run of
+                the same file; skips parsing the file again
+            applied_imports: Maps (file signature, target_zone, mode) keys of
+                completed imports to the zone's ``touched`` time right after
+                them; a matching import is skipped while the zone is unchanged
+            cancel_check: Optional callable; when it returns True the import
+                stops with OperationCancelled before its next API batch
+            force: Import even if ``applied_imports`` says it is already applied
             
         Returns:
-            Tuple of (success, message, preview_data)
+            Tuple of (success, message, preview_data). A completed import
+            without failures returns ``{'import_key': key, 'zone_touched': t}``
+            (None if the zone state could not be read); a skipped one returns
+            ``{'skipped': True}``.
         """
         try:
             if not os.path.exists(file_path):
@@ -255,14 +479,18 @@ class ImportExportManager:
                 progress_callback(5, "Reading import file...")
         
             # Parse based on format
-            if format_type == 'json':
-                zone_data, records = self._import_json(file_path)
+            limit = preview_limit if dry_run else None
+            if prepared_data is not None:
+                zone_data, records = prepared_data['zone'], prepared_data['records']
+                total = len(records)
+            elif format_type == 'json':
+                zone_data, records, total = self._import_json(file_path)
             elif format_type == 'yaml':
-                zone_data, records = self._import_yaml(file_path)
+                zone_data, records, total = self._import_yaml(file_path)
             elif format_type == 'bind':
-                zone_data, records = self._import_bind(file_path)
+                zone_data, records, total = self._import_bind(file_path, limit)
             elif format_type == 'djbdns':
-                zone_data, records = self._import_djbdns(file_path)
+                zone_data, records, total = self._import_djbdns(file_path, limit)
             else:
                 return False, f"Unsupported format: {format_type}", None
         
@@ -280,7 +508,8 @@ class ImportExportManager:
                 preview = {
                     'zone': zone_data,
                     'records': records,
-                    'record_count': len(records),
+                    'record_count': total,
+                    'truncated': total > len(records),
                     'target_zone': zone_data['name'],
                     'existing_records_mode': existing_records_mode
                 }
@@ -289,274 +518,384 @@ class ImportExportManager:
                     'merge': 'merge matching', 
                     'replace': 'replace all'
                 }.get(existing_records_mode, existing_records_mode)
-                return True, f"Import preview: {len(records)} records to zone '{zone_data['name']}' ({mode_desc})" , preview
+                count_desc = f"~{total}" if total > len(records) else str(total)
+                return True, f"Import preview: {count_desc} records to zone '{zone_data['name']}' ({mode_desc})" , preview
+            
+            # Skip a file already applied to the zone in this mode, but only
+            # while the zone is still in the state that import left it in
+            import_key = (self.file_signature(file_path), target_zone, existing_records_mode)
+            applied_touched = None if force or not applied_imports else applied_imports.get(import_key)
+            if applied_touched is not None and applied_touched == self._zone_touched(zone_data['name']):
+                return True, (
+                    f"Import skipped: this file was already imported into zone "
+                    f"'{zone_data['name']}' and the zone has not changed since"
+                ), {'skipped': True}
             
             # Create zone and records
             if progress_callback:
                 progress_callback(25, "Creating zone and records...")
-            success, message = self._create_zone_and_records(zone_data, records, existing_records_mode, progress_callback)
+            self._check_cancelled(cancel_check)
+            success, message, failed_count = self._create_zone_and_records(
+                zone_data, records, existing_records_mode, progress_callback,
+                cancel_check
+            )
+            if success and failed_count == 0:
+                return success, message, {
+                    'import_key': import_key,
+                    'zone_touched': self._zone_touched(zone_data['name']),
+                }
             return success, message, None
             
+        except OperationCancelled:
+            raise
         except Exception as e:
             logger.error(f"Import failed: {e}")
             return False, f"Import failed: {str(e)}", None
     
-    def _export_json(self, zone_data: Dict, records: List[Dict], 
-                    file_path: str, include_metadata: bool) -> Tuple[bool, str]:
-        """Export to JSON format."""
-        export_data = {
-            'format': 'deSEC JSON Export',
-            'version': '1.0',
-            'exported_at': datetime.now().isoformat(),
-            'zone': zone_data,
-            'records': records
-        }
-        
+    def _write_zone(self, f, zone_data: Dict, records: List[Dict],
+                    format_type: str, include_metadata: bool) -> None:
+        """Write a zone to the text stream ``f`` in the specified format.
+
+        JSON and YAML are emitted one record at a time, so neither the full
+        document nor a metadata-stripped copy of the records is ever built.
+
+        Raises:
+            ValueError: If the format is not supported
+        """
+        if format_type == 'json':
+            self._write_json(f, self._export_header(
+                'deSEC JSON Export', zone_data, include_metadata
+            ), self._iter_export_records(records, include_metadata))
+        elif format_type == 'yaml':
+            self._write_yaml(f, self._export_header(
+                'deSEC YAML Export', zone_data, include_metadata
+            ), self._iter_export_records(records, include_metadata))
+        elif format_type == 'bind':
+            self._write_bind(f, zone_data, records)
+        elif format_type == 'djbdns':
+            self._write_djbdns(f, zone_data, records)
+        else:
+            raise ValueError(f"Unsupported export format: {format_type}")
+
+    def _export_header(self, format_name: str, zone_data: Dict,
+                       include_metadata: bool) -> Dict:
+        """Build the JSON/YAML export document without its records."""
         if not include_metadata:
-            # Remove metadata fields
-            for record in export_data['records']:
-                record.pop('created', None)
-                record.pop('touched', None)
-            export_data['zone'].pop('created', None)
-            export_data['zone'].pop('published', None)
-            export_data['zone'].pop('touched', None)
-        
-        with open(file_path, 'w') as f:
-            json.dump(export_data, f, indent=2)
-        
-        return True, f"Exported {len(records)} records to JSON"
-    
-    def _export_yaml(self, zone_data: Dict, records: List[Dict], 
-                    file_path: str, include_metadata: bool) -> Tuple[bool, str]:
-        """Export to YAML format."""
-        export_data = {
-            'format': 'deSEC YAML Export',
+            # Leave the cached zone untouched
+            zone_data = {k: v for k, v in zone_data.items()
+                         if k not in ('created', 'published', 'touched')}
+        return {
+            'format': format_name,
             'version': '1.0',
             'exported_at': datetime.now().isoformat(),
-            'zone': zone_data,
-            'records': records
+            'zone': zone_data
         }
-        
-        if not include_metadata:
-            for record in export_data['records']:
-                record.pop('created', None)
-                record.pop('touched', None)
-            export_data['zone'].pop('created', None)
-            export_data['zone'].pop('published', None)
-            export_data['zone'].pop('touched', None)
-        
-        with open(file_path, 'w') as f:
-            yaml.dump(export_data, f, default_flow_style=False, indent=2)
-        
-        return True, f"Exported {len(records)} records to YAML"
-    
-    def _export_bind(self, zone_data: Dict, records: List[Dict], 
-                    file_path: str) -> Tuple[bool, str]:
-        """Export to BIND zone file format."""
+
+    def _iter_export_records(self, records: List[Dict],
+                             include_metadata: bool) -> Iterable[Dict]:
+        """Yield records for export, dropping metadata fields if requested."""
+        if include_metadata:
+            return records
+        return ({k: v for k, v in record.items() if k not in ('created', 'touched')}
+                for record in records)
+
+    def _write_json(self, f, header: Dict, records: Iterable[Dict]) -> None:
+        """Write a JSON export laid out as ``json.dump(..., indent=2)`` would.
+
+        The header fields come first and ``records`` last; each record is
+        encoded on its own. JSON strings escape newlines, so re-indenting
+        the nested documents by replacing newlines is safe.
+        """
+        f.write('{\n')
+        for key, value in header.items():
+            encoded = _json_dumps_indented(value).replace('\n', '\n  ')
+            f.write(f'  {json.dumps(key)}: {encoded},\n')
+        f.write('  "records": [')
+        separator = '\n    '
+        for record in records:
+            f.write(separator)
+            f.write(_json_dumps_indented(record).replace('\n', '\n    '))
+            separator = ',\n    '
+        f.write(']\n}' if separator == '\n    ' else '\n  ]\n}')
+
+    def _write_yaml(self, f, header: Dict, records: Iterable[Dict]) -> None:
+        """Write a YAML export laid out as ``yaml.dump`` would.
+
+        yaml.dump sorts the top-level keys, so ``records`` is written
+        between the header keys that sort before and after it; each record
+        is dumped as its own one-item sequence.
+        """
+        yaml.dump({k: v for k, v in header.items() if k < 'records'},
+                  f, Dumper=_YamlDumper, default_flow_style=False, indent=2)
+        f.write('records:')
+        empty = True
+        for record in records:
+            if empty:
+                f.write('\n')
+                empty = False
+            yaml.dump([record], f, Dumper=_YamlDumper, default_flow_style=False, indent=2)
+        if empty:
+            f.write(' []\n')
+        yaml.dump({k: v for k, v in header.items() if k > 'records'},
+                  f, Dumper=_YamlDumper, default_flow_style=False, indent=2)
+
+    def _write_bind(self, f, zone_data: Dict, records: List[Dict]) -> None:
+        """Write a BIND zone file to ``f``, one line per record."""
         zone_name = zone_data['name']
-        lines = [
-            f"; BIND zone file for {zone_name}",
-            f"; Generated by deSEC Qt DNS Manager on {datetime.now().isoformat()}",
-            f"",
-            f"$ORIGIN {zone_name}.",
-            f"$TTL {zone_data.get('minimum_ttl', 3600)}",
-            f""
-        ]
+        f.write(
+            f"; BIND zone file for {zone_name}\n"
+            f"; Generated by deSEC Qt DNS Manager on {datetime.now().isoformat()}\n"
+            f"\n"
+            f"$ORIGIN {zone_name}.\n"
+            f"$TTL {zone_data.get('minimum_ttl', 3600)}\n"
+            f"\n"
+        )
         
         # Sort records by type and subname for better organization
-        sorted_records = sorted(records, key=lambda r: (r['type'], r['subname']))
-        
-        for record in sorted_records:
+        for record in sorted(records, key=operator.itemgetter('type', 'subname')):
             subname = record['subname'] if record['subname'] else '@'
-            ttl = record['ttl']
-            rtype = record['type']
-            
+            prefix = f"{subname:<20} {record['ttl']:<8} IN {record['type']:<8} "
             for content in record['records']:
-                lines.append(f"{subname:<20} {ttl:<8} IN {rtype:<8} {content}")
-        
-        with open(file_path, 'w') as f:
-            f.write('\n'.join(lines))
-        
-        return True, f"Exported {len(records)} records to BIND format"
-    
-    def _export_djbdns(self, zone_data: Dict, records: List[Dict], 
-                      file_path: str) -> Tuple[bool, str]:
-        """Export to djbdns/tinydns format."""
+                f.write(f"{prefix}{content}\n")
+
+    def _write_djbdns(self, f, zone_data: Dict, records: List[Dict]) -> None:
+        """Write a djbdns/tinydns data file to ``f``, one line per record."""
         zone_name = zone_data['name']
-        lines = [
-            f"# djbdns/tinydns data file for {zone_name}",
-            f"# Generated by deSEC Qt DNS Manager on {datetime.now().isoformat()}",
-            f""
-        ]
+        f.write(
+            f"# djbdns/tinydns data file for {zone_name}\n"
+            f"# Generated by deSEC Qt DNS Manager on {datetime.now().isoformat()}\n"
+            f"\n"
+        )
         
         for record in records:
             fqdn = f"{record['subname']}.{zone_name}" if record['subname'] else zone_name
             ttl = record['ttl']
             rtype = record['type']
+            prefix = self.DJBDNS_PREFIXES.get(rtype)
             
             for content in record['records']:
-                if rtype == 'A':
-                    lines.append(f"+{fqdn}:{content}:{ttl}")
-                elif rtype == 'AAAA':
-                    lines.append(f"6{fqdn}:{content}:{ttl}")
-                elif rtype == 'CNAME':
-                    lines.append(f"C{fqdn}:{content}:{ttl}")
+                if prefix:
+                    f.write(f"{prefix}{fqdn}:{content}:{ttl}\n")
                 elif rtype == 'MX':
                     priority, target = content.split(' ', 1)
-                    lines.append(f"@{fqdn}::{target}:{priority}:{ttl}")
-                elif rtype == 'TXT':
-                    lines.append(f"'{fqdn}:{content}:{ttl}")
+                    f.write(f"@{fqdn}::{target}:{priority}:{ttl}\n")
                 elif rtype == 'NS':
-                    lines.append(f"&{fqdn}::{content}:{ttl}")
+                    f.write(f"&{fqdn}::{content}:{ttl}\n")
+
+    def _open_export_file(self, file_path: str, compress: Optional[str] = None):
+        """Open an export file for writing text, gzip-compressed if requested."""
+        if compress == 'gzip':
+            return gzip.open(file_path, 'wt', compresslevel=6, encoding='utf-8')
+        return open(file_path, 'w', encoding='utf-8')
+
+    def _export_json(self, zone_data: Dict, records: List[Dict], 
+                    file_path: str, include_metadata: bool,
+                    compress: Optional[str] = None) -> Tuple[bool, str]:
+        """Export to JSON format."""
+        with self._open_export_file(file_path, compress) as f:
+            self._write_zone(f, zone_data, records, 'json', include_metadata)
+        
+        return True, f"Exported {len(records)} records to JSON"
+    
+    def _export_yaml(self, zone_data: Dict, records: List[Dict], 
+                    file_path: str, include_metadata: bool,
+                    compress: Optional[str] = None) -> Tuple[bool, str]:
+        """Export to YAML format."""
+        with self._open_export_file(file_path, compress) as f:
+            self._write_zone(f, zone_data, records, 'yaml', include_metadata)
         
-        with open(file_path, 'w') as f:
-            f.write('\n'.join(lines))
+        return True, f"Exported {len(records)} records to YAML"
+    
+    def _export_bind(self, zone_data: Dict, records: List[Dict], 
+                    file_path: str, compress: Optional[str] = None) -> Tuple[bool, str]:
+        """Export to BIND zone file format."""
+        with self._open_export_file(file_path, compress) as f:
+            self._write_zone(f, zone_data, records, 'bind', False)
+        
+        return True, f"Exported {len(records)} records to BIND format"
+    
+    def _export_djbdns(self, zone_data: Dict, records: List[Dict], 
+                      file_path: str, compress: Optional[str] = None) -> Tuple[bool, str]:
+        """Export to djbdns/tinydns format."""
+        with self._open_export_file(file_path, compress) as f:
+            self._write_zone(f, zone_data, records, 'djbdns', False)
         
         return True, f"Exported {len(records)} records to djbdns format"
     
-    def _import_json(self, file_path: str) -> Tuple[Dict, List[Dict]]:
+    def _estimate_record_count(self, file_path: str, parsed: int, consumed: int) -> int:
+        """Extrapolate the total record count of a partially parsed file.
+        
+        Parsing stopped before the end of the file, so the estimate always
+        exceeds ``parsed``; the result then reads as truncated even if the
+        stop fell inside an RRset whose remaining lines are not yet seen.
+        """
+        if consumed <= 0:
+            return parsed + 1
+        return max(parsed + 1, int(parsed * os.path.getsize(file_path) / consumed))
+
+    def _import_json(self, file_path: str) -> Tuple[Dict, List[Dict], int]:
         """Import from JSON format."""
-        with open(file_path, 'r') as f:
-            data = json.load(f)
+        with open(file_path, 'rb') as f:
+            data = _json_loads(f.read())
         
         if 'zone' in data and 'records' in data:
-            return data['zone'], data['records']
+            zone_data, records = data['zone'], data['records']
         else:
             # Assume direct zone/records format
-            return data.get('zone', {}), data.get('records', [])
+            zone_data, records = data.get('zone', {}), data.get('records', [])
+        
+        return zone_data, records, len(records)
     
-    def _import_yaml(self, file_path: str) -> Tuple[Dict, List[Dict]]:
+    def _import_yaml(self, file_path: str) -> Tuple[Dict, List[Dict], int]:
         """Import from YAML format."""
         with open(file_path, 'r') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
         
         if 'zone' in data and 'records' in data:
-            return data['zone'], data['records']
+            zone_data, records = data['zone'], data['records']
         else:
-            return data.get('zone', {}), data.get('records', [])
+            zone_data, records = data.get('zone', {}), data.get('records', [])
+        
+        return zone_data, records, len(records)
     
-    def _import_bind(self, file_path: str) -> Tuple[Dict, List[Dict]]:
-        """Import from BIND zone file format."""
-        with open(file_path, 'r') as f:
-            content = f.read()
+    def _import_bind(self, file_path: str, limit: Optional[int] = None) -> Tuple[Dict, List[Dict], int]:
+        """Import from BIND zone file format.
         
+        Lines sharing owner and type are merged into one RRset, as deSEC
+        models them; the first line's TTL applies to the whole RRset.
+        When ``limit`` is given, parsing stops after that many RRsets and
+        the total is extrapolated from the share of the file consumed.
+        """
         # Parse BIND zone file (simplified parser)
         zone_name = None
         default_ttl = 3600
-        records = []
+        rrsets = {}
+        total = None
+        consumed = 0
         
-        for line in content.split('\n'):
-            line = line.strip()
-            if not line or line.startswith(';'):
-                continue
-            
-            if line.startswith('$ORIGIN'):
-                zone_name = line.split()[1].rstrip('.')
-            elif line.startswith('$TTL'):
-                try:
-                    default_ttl = int(line.split()[1])
-                except (ValueError, IndexError):
-                    logger.warning(f"Malformed $TTL directive, using default: {line!r}")
-            else:
-                # Parse record line
-                parts = line.split()
-                if len(parts) >= 4:
-                    name = parts[0]
-                    if name == '@':
-                        subname = ''
-                    else:
-                        subname = name
-                    
-                    # Find TTL, IN, TYPE, DATA
-                    ttl = default_ttl
-                    rtype = None
-                    data = None
-                    
-                    for i, part in enumerate(parts[1:], 1):
-                        if part.isdigit():
-                            ttl = int(part)
-                        elif part == 'IN':
-                            continue
-                        elif part.isupper() and len(part) <= 6:
-                            rtype = part
-                            data = ' '.join(parts[i+1:])
-                            break
-                    
-                    if rtype and data:
-                        records.append({
-                            'subname': subname,
-                            'type': rtype,
-                            'ttl': ttl,
-                            'records': [data]
-                        })
+        with open(file_path, 'r') as f:
+            for line in f:
+                if limit is not None and len(rrsets) >= limit:
+                    total = self._estimate_record_count(file_path, len(rrsets), consumed)
+                    break
+                consumed += len(line)
+                line = line.strip()
+                if not line or line.startswith(';'):
+                    continue
+                
+                if line[0] == '$':
+                    if line.startswith('$ORIGIN'):
+                        zone_name = line.split()[1].rstrip('.')
+                    elif line.startswith('$TTL'):
+                        try:
+                            default_ttl = int(line.split()[1])
+                        except (ValueError, IndexError):
+                            logger.warning(f"Malformed $TTL directive, using default: {line!r}")
+                    continue
+                
+                # Parse record line: one regex match splits out every field
+                match = _BIND_RECORD_RE.match(line)
+                if not match:
+                    continue
+                name, ttl_before, ttl_after, rtype, data = match.groups()
+                subname = '' if name == '@' else name
+                # Single-space the data as the API expects, but leave the
+                # inside of quoted strings (TXT, CAA values) untouched
+                if '"' in data:
+                    data = ' '.join(_BIND_DATA_TOKEN_RE.findall(data))
+                else:
+                    data = ' '.join(data.split())
+                rrset = rrsets.get((subname, rtype))
+                if rrset is not None:
+                    rrset['records'].append(data)
+                    continue
+                
+                ttl_str = ttl_before or ttl_after
+                # Types and short labels repeat across lines; interning
+                # shares one object per value for the merge key lookups
+                rrsets[(subname, rtype)] = {
+                    'subname': intern(subname) if len(subname) < 32 else subname,
+                    'type': intern(rtype),
+                    'ttl': int(ttl_str) if ttl_str else default_ttl,
+                    'records': [data]
+                }
         
         zone_data = {
             'name': zone_name or 'imported-zone.com',
             'minimum_ttl': default_ttl
         }
         
-        return zone_data, records
+        records = list(rrsets.values())
+        return zone_data, records, total if total is not None else len(records)
     
-    def _import_djbdns(self, file_path: str) -> Tuple[Dict, List[Dict]]:
-        """Import from djbdns/tinydns format."""
-        with open(file_path, 'r') as f:
-            content = f.read()
+    def _import_djbdns(self, file_path: str, limit: Optional[int] = None) -> Tuple[Dict, List[Dict], int]:
+        """Import from djbdns/tinydns format.
         
-        records = []
+        Lines are merged into RRsets and ``limit`` behaves as for
+        :meth:`_import_bind`.
+        """
+        rrsets = {}
         zone_name = None
+        total = None
+        consumed = 0
         
-        for line in content.split('\n'):
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-            
-            if line.startswith('+'):  # A record
-                parts = line[1:].split(':')
-                if len(parts) >= 3:
-                    fqdn, ip, ttl_str = parts[0], parts[1], parts[2] or '3600'
-                    try:
-                        ttl_val = int(ttl_str)
-                    except (ValueError, TypeError):
-                        ttl_val = 3600
-                    if not zone_name:
-                        zone_name = '.'.join(fqdn.split('.')[1:])
-                    subname = fqdn.split('.')[0] if '.' in fqdn else ''
-                    records.append({
-                        'subname': subname,
-                        'type': 'A',
-                        'ttl': ttl_val,
-                        'records': [ip]
-                    })
-
-            elif line.startswith('C'):  # CNAME record
+        with open(file_path, 'r') as f:
+            for line in f:
+                if limit is not None and len(rrsets) >= limit:
+                    total = self._estimate_record_count(file_path, len(rrsets), consumed)
+                    break
+                consumed += len(line)
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                
+                if line.startswith('+'):  # A record
+                    rtype = 'A'
+                elif line.startswith('C'):  # CNAME record
+                    rtype = 'CNAME'
+                else:
+                    continue
+                
                 parts = line[1:].split(':')
-                if len(parts) >= 3:
-                    fqdn, target, ttl_str = parts[0], parts[1], parts[2] or '3600'
-                    try:
-                        ttl_val = int(ttl_str)
-                    except (ValueError, TypeError):
-                        ttl_val = 3600
-                    if not zone_name:
-                        zone_name = '.'.join(fqdn.split('.')[1:])
-                    subname = fqdn.split('.')[0] if '.' in fqdn else ''
-                    records.append({
-                        'subname': subname,
-                        'type': 'CNAME',
-                        'ttl': ttl_val,
-                        'records': [target]
-                    })
+                if len(parts) < 3:
+                    continue
+                fqdn, content, ttl_str = parts[0], parts[1], parts[2] or '3600'
+                if not zone_name:
+                    zone_name = '.'.join(fqdn.split('.')[1:])
+                subname = fqdn.split('.')[0] if '.' in fqdn else ''
+                rrset = rrsets.get((subname, rtype))
+                if rrset is not None:
+                    rrset['records'].append(content)
+                    continue
+                
+                try:
+                    ttl_val = int(ttl_str)
+                except (ValueError, TypeError):
+                    ttl_val = 3600
+                rrsets[(subname, rtype)] = {
+                    'subname': intern(subname) if len(subname) < 32 else subname,
+                    'type': rtype,
+                    'ttl': ttl_val,
+                    'records': [content]
+                }
         
         zone_data = {
             'name': zone_name or 'imported-zone.com',
             'minimum_ttl': 3600
         }
         
-        return zone_data, records
+        records = list(rrsets.values())
+        return zone_data, records, total if total is not None else len(records)
     
     def _create_zone_and_records(self, zone_data: Dict, 
                            records: List[Dict], existing_records_mode: str = 'ignore', 
-                           progress_callback=None) -> Tuple[bool, str]:
-        """Create zone and records via API."""
+                           progress_callback=None,
+                           cancel_check=None) -> Tuple[bool, str, int]:
+        """Create zone and records via API.
+        
+        Returns:
+            Tuple of (success, message, failed_record_count)
+        """
         zone_name = zone_data['name']
         
         # Check if zone exists
@@ -567,23 +906,25 @@ class ImportExportManager:
                 progress_callback(30, f"Creating zone {zone_name}...")
             success, result = self.api_client.create_zone(zone_name)
             if not success:
-                return False, f"Failed to create zone: {result}"
+                return False, f"Failed to create zone: {result}", len(records)
         else:
             # Zone exists - handle existing records based on mode
             if existing_records_mode == 'replace':
                 # Delete all existing records first (replace mode)
                 if progress_callback:
                     progress_callback(35, "Deleting existing records...")
-                success, message = self._delete_all_zone_records(zone_name)
+                success, message = self._delete_all_zone_records(zone_name, cancel_check)
                 if not success:
-                    return False, f"Failed to replace existing records: {message}"
+                    return False, f"Failed to replace existing records: {message}", len(records)
         
         # Handle records based on mode
         if existing_records_mode == 'merge' and existing_zone:
             # Merge mode: only update records that exist in both zone and import file
             if progress_callback:
                 progress_callback(40, "Merging existing records...")
-            created_count, updated_count, failed_count = self._overwrite_matching_records(zone_name, records, progress_callback)
+            created_count, updated_count, failed_count = self._overwrite_matching_records(
+                zone_name, records, progress_callback, cancel_check
+            )
         else:
             # Append mode or new zone: create all records
             created_count = 0
@@ -594,25 +935,15 @@ class ImportExportManager:
             if progress_callback:
                 progress_callback(40, f"Creating {total_records} records...")
             
-            for i, record in enumerate(records):
-                success, result = self.api_client.create_record(
-                    zone_name,
-                    record['subname'],
-                    record['type'],
-                    record['ttl'],
-                    record['records']
-                )
-                
+            changes = [('create', record) for record in records]
+            results = self._apply_rrset_changes(zone_name, changes, progress_callback, "Created",
+                                                 cancel_check)
+            for (_, record), success, result in results:
                 if success:
                     created_count += 1
                 else:
                     failed_count += 1
                     logger.warning(f"Failed to create record {record}: {result}")
-                
-                # Report progress for each record created
-                if progress_callback and total_records > 0:
-                    progress_percent = 40 + int((i + 1) / total_records * 50)  # 40-90% range
-                    progress_callback(progress_percent, f"Created {i + 1}/{total_records} records...")
         
         # Report final completion
         if progress_callback:
@@ -639,105 +970,265 @@ class ImportExportManager:
         elif existing_zone and existing_records_mode == 'append':
             message = f"Records appended to existing zone. {message}"
         
-        return True, message
+        return True, message, failed_count
     
+    def _fetch_bulk_entry(self, zone_name: str) -> Optional[Tuple[Dict, List[Dict]]]:
+        """Look up one zone and its records for a bulk export.
+        
+        Runs on a bulk-export pool thread.
+        
+        Returns:
+            Tuple of (zone data, records), or None if the zone is not available
+        """
+        # Get zone data from cache
+        zone_data = self.cache_manager.get_zone_by_name(zone_name)
+        if not zone_data:
+            logger.warning(f"Zone {zone_name} not found in cache, skipping")
+            return None
+
+        # Get records — try cache first, fall back to API
+        records, _ = self.cache_manager.get_cached_records(zone_name)
+        if records is None:
+            success, api_records = self.api_client.get_records(zone_name)
+            if success and api_records:
+                records = api_records
+                self.cache_manager.cache_records(zone_name, records)
+            else:
+                logger.warning(f"Records for zone {zone_name} not available, skipping")
+                return None
+        return zone_data, records
+
+    def _archived_export(self, member_name: str, suffix: str) -> Optional[Tuple[str, datetime]]:
+        """Parse a bulk-export member name into (cleaned zone name, export time).
+        
+        Member names come from generate_export_filename, whose timestamp
+        records when the zone was exported. Returns None for members that
+        are not ``suffix`` exports.
+        """
+        prefix, sep, rest = member_name.rpartition('_export_')
+        if not sep or not rest.endswith(suffix):
+            return None
+        try:
+            exported_at = datetime.strptime(rest[:-len(suffix)], "%Y%m%d_%H%M%S")
+        except ValueError:
+            # Unknown stamp; treat as stale so the zone is exported again
+            exported_at = datetime.min
+        return prefix, exported_at
+
+    def _archived_export_times(self, zip_path: str, format_type: str) -> Dict[str, datetime]:
+        """Map each zone already exported into ``zip_path`` to its newest export time.
+
+        Keys are the cleaned zone names used by generate_export_filename;
+        only members of ``format_type`` are considered.
+        """
+        suffix = f".{self.FORMAT_EXTENSIONS.get(format_type, 'txt')}"
+        times = {}
+        with zipfile.ZipFile(zip_path, 'r') as zip_file:
+            for name in zip_file.namelist():
+                parsed = self._archived_export(name, suffix)
+                if parsed is None:
+                    continue
+                key, exported_at = parsed
+                if key not in times or exported_at > times[key]:
+                    times[key] = exported_at
+        return times
+
+    def _copy_archived_members(self, zip_path: str, zip_file: zipfile.ZipFile,
+                               replaced: Collection[str], format_type: str,
+                               compresslevel: int) -> None:
+        """Copy the still-current members of ``zip_path`` into ``zip_file``.
+
+        Exports of zones in ``replaced`` (cleaned names) are dropped, as is
+        every export of a zone but its newest, so each zone appears once in
+        the rebuilt archive. Other members are copied unchanged. Members
+        are copied one at a time, keeping their original timestamps.
+        """
+        suffix = f".{self.FORMAT_EXTENSIONS.get(format_type, 'txt')}"
+        with zipfile.ZipFile(zip_path, 'r') as source:
+            infos = source.infolist()
+            parsed = [self._archived_export(info.filename, suffix) for info in infos]
+            newest = {}
+            for info, entry in zip(infos, parsed):
+                if entry is not None and (entry[0] not in newest
+                                          or entry[1] > newest[entry[0]][1]):
+                    newest[entry[0]] = (info, entry[1])
+            for info, entry in zip(infos, parsed):
+                if entry is not None and (entry[0] in replaced
+                                          or newest[entry[0]][0] is not info):
+                    continue
+                copied = zipfile.ZipInfo(info.filename, info.date_time)
+                copied.external_attr = info.external_attr
+                zip_file.writestr(copied, source.read(info),
+                                  compress_type=zip_file.compression,
+                                  compresslevel=compresslevel)
+
+    def _zone_changed_since(self, zone_name: str, since: datetime) -> bool:
+        """Whether the cached zone was touched after ``since`` (local time).
+
+        Zones without a usable ``touched`` timestamp count as changed.
+        """
+        zone_data = self.cache_manager.get_zone_by_name(zone_name) or {}
+        touched = zone_data.get('touched')
+        if not touched:
+            return True
+        try:
+            touched_at = datetime.fromisoformat(touched.replace('Z', '+00:00'))
+        except (TypeError, ValueError):
+            return True
+        if touched_at.tzinfo is not None:
+            touched_at = touched_at.astimezone().replace(tzinfo=None)
+        return touched_at > since
+
     def export_zones_bulk(self, zone_names: List[str], format_type: str, file_path: str, 
-                         include_metadata: bool = True, progress_callback=None) -> Tuple[bool, str]:
+                         include_metadata: bool = True, progress_callback=None,
+                         compresslevel: int = 1,
+                         compression: str = 'deflate',
+                         update_existing: bool = False,
+                         cancel_check=None) -> Tuple[bool, str]:
         """Export multiple zones to a ZIP archive.
         
+        Zones are looked up on a small thread pool so that API round-trips
+        for uncached zones overlap with writing earlier ones. Only the
+        calling thread writes to the archive, in selection order: each zone
+        is serialized straight into its ZIP member through a buffered text
+        stream, so no whole-zone string or byte copy is built.
+        
         Args:
             zone_names: List of zone names to export
             format_type: Export format ('json', 'yaml', 'bind', 'djbdns')
             file_path: Output ZIP file path
             include_metadata: Include timestamps and metadata
             progress_callback: Optional callback for progress updates
+            compresslevel: DEFLATE compression level (0-9); 1 is several
+                times faster than 6 on zone text for a slightly larger archive
+            compression: 'deflate', or 'stored' to skip compression entirely
+            update_existing: If file_path is an existing archive, re-export
+                only zones changed since the export time in their member
+                name; the
+                archive is rebuilt with the other members carried over and
+                the superseded ones dropped
+            cancel_check: Optional callable; when it returns True the export
+                stops with OperationCancelled before writing the next zone
             
         Returns:
             Tuple of (success, message)
         """
+        if format_type not in self.SUPPORTED_FORMATS:
+            return False, f"Unsupported export format: {format_type}"
+        if compression not in self.ZIP_COMPRESSION:
+            return False, f"Unsupported ZIP compression: {compression}"
+
         try:
             if progress_callback:
                 progress_callback(0, "Starting bulk export...")
             
-            # Create temporary directory for individual zone files
-            with tempfile.TemporaryDirectory() as temp_dir:
-                exported_files = []
-                total_zones = len(zone_names)
-                
-                # Export each zone to temporary files
-                for i, zone_name in enumerate(zone_names):
+            update = update_existing and os.path.isfile(file_path)
+            unchanged_count = 0
+            if update:
+                archived = self._archived_export_times(file_path, format_type)
+                requested = zone_names
+                zone_names = [
+                    z for z in requested
+                    if z.replace('.', '_') not in archived
+                    or self._zone_changed_since(z, archived[z.replace('.', '_')])
+                ]
+                unchanged_count = len(requested) - len(zone_names)
+                if not zone_names:
                     if progress_callback:
-                        progress = int((i / total_zones) * 80)  # Use 80% for individual exports
-                        progress_callback(progress, f"Exporting zone {i+1}/{total_zones}: {zone_name}")
-                    
-                    # Get zone data from cache
-                    zone_data = self.cache_manager.get_zone_by_name(zone_name)
-                    if not zone_data:
-                        logger.warning(f"Zone {zone_name} not found in cache, skipping")
-                        continue
-
-                    # Get records — try cache first, fall back to API
-                    records, _ = self.cache_manager.get_cached_records(zone_name)
-                    if records is None:
-                        success, api_records = self.api_client.get_records(zone_name)
-                        if success and api_records:
-                            records = api_records
-                            self.cache_manager.cache_records(zone_name, records)
-                        else:
-                            logger.warning(f"Records for zone {zone_name} not available, skipping")
+                        progress_callback(100, "Archive already up to date")
+                    return True, f"Archive already up to date: {unchanged_count} zones unchanged in {file_path}"
+            
+            # An update is built next to the archive and only replaces it
+            # once complete, so a failed or cancelled run leaves it intact
+            out_path = file_path
+            if update:
+                fd, out_path = tempfile.mkstemp(
+                    dir=os.path.dirname(os.path.abspath(file_path)), suffix=".tmp"
+                )
+                os.close(fd)
+            
+            exported_count = 0
+            exported_keys = set()
+            total_zones = len(zone_names)
+            window = 2 * self.BULK_EXPORT_WORKERS
+            pending = deque()
+            remaining = iter(zone_names)
+            
+            executor = ThreadPoolExecutor(
+                max_workers=self.BULK_EXPORT_WORKERS,
+                thread_name_prefix="bulk-export",
+            )
+            try:
+                with zipfile.ZipFile(out_path, 'w',
+                                     self.ZIP_COMPRESSION[compression],
+                                     compresslevel=compresslevel) as zip_file:
+                    for i in range(total_zones):
+                        # Keep the window of in-flight zones topped up
+                        for zone_name in islice(remaining, window - len(pending)):
+                            pending.append((zone_name, executor.submit(
+                                self._fetch_bulk_entry, zone_name
+                            )))
+                        zone_name, future = pending.popleft()
+                        self._check_cancelled(cancel_check)
+                        if progress_callback:
+                            progress = int((i / total_zones) * 95)
+                            progress_callback(progress, f"Exporting zone {i+1}/{total_zones}: {zone_name}")
+                        
+                        entry = future.result()
+                        if entry is None:
+                            # Continue with other zones instead of failing completely
                             continue
+                        zone_data, records = entry
+                        # Opened by name, the member takes the archive's
+                        # compression and compresslevel; the export time that
+                        # update_existing compares is part of the name
+                        zone_filename = self.generate_export_filename(zone_name, format_type)
+                        try:
+                            member = zip_file.open(zone_filename, 'w', force_zip64=True)
+                            with io.TextIOWrapper(member, encoding='utf-8') as f:
+                                self._write_zone(f, zone_data, records,
+                                                 format_type, include_metadata)
+                        except Exception as e:
+                            # The member is closed, possibly truncated; keep going
+                            logger.error(f"Failed to export zone {zone_name}: {e}")
+                            continue
+                        exported_keys.add(zone_name.replace('.', '_'))
+                        exported_count += 1
                     
-                    # Generate filename for this zone
-                    zone_filename = self.generate_export_filename(zone_name, format_type)
-                    temp_file_path = os.path.join(temp_dir, zone_filename)
-                    
-                    # Export zone to temporary file
-                    try:
-                        if format_type == 'json':
-                            self._export_json(zone_data, records, temp_file_path, include_metadata)
-                        elif format_type == 'yaml':
-                            self._export_yaml(zone_data, records, temp_file_path, include_metadata)
-                        elif format_type == 'bind':
-                            self._export_bind(zone_data, records, temp_file_path)
-                        elif format_type == 'djbdns':
-                            self._export_djbdns(zone_data, records, temp_file_path)
-                        else:
-                            return False, f"Unsupported export format: {format_type}"
-                        
-                        exported_files.append((zone_filename, temp_file_path))
-                        
-                    except Exception as e:
-                        logger.error(f"Failed to export zone {zone_name}: {e}")
-                        # Continue with other zones instead of failing completely
-                        continue
-                
-                if not exported_files:
-                    return False, "No zones were successfully exported"
-                
-                if progress_callback:
-                    progress_callback(85, "Creating ZIP archive...")
-                
-                # Create ZIP archive
-                with zipfile.ZipFile(file_path, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-                    for zone_filename, temp_file_path in exported_files:
-                        zip_file.write(temp_file_path, zone_filename)
-                        if progress_callback:
-                            current_progress = 85 + int((len([f for f in exported_files if f[0] <= zone_filename]) / len(exported_files)) * 10)
-                            progress_callback(current_progress, f"Adding {zone_filename} to ZIP...")
-                
-                if progress_callback:
-                    progress_callback(100, "Bulk export completed successfully!")
-                
-                successful_count = len(exported_files)
-                failed_count = total_zones - successful_count
-                
-                message = f"Bulk export completed: {successful_count} zones exported to {file_path}"
-                if failed_count > 0:
-                    message += f" ({failed_count} zones failed to export)"
-                
-                logger.info(f"Bulk export completed: {successful_count}/{total_zones} zones exported")
-                return True, message
+                    if update and exported_count:
+                        self._check_cancelled(cancel_check)
+                        self._copy_archived_members(file_path, zip_file, exported_keys,
+                                                    format_type, compresslevel)
+                if update and exported_count:
+                    os.replace(out_path, file_path)
+            except BaseException:
+                if update:
+                    os.unlink(out_path)
+                raise
+            finally:
+                # Drop queued zones if we are unwinding early (e.g. cancelled)
+                executor.shutdown(wait=True, cancel_futures=True)
+            
+            if not exported_count:
+                os.remove(out_path)
+                return False, "No zones were successfully exported"
+            
+            if progress_callback:
+                progress_callback(100, "Bulk export completed successfully!")
+            
+            failed_count = total_zones - exported_count
+            
+            message = f"Bulk export completed: {exported_count} zones exported to {file_path}"
+            if failed_count > 0:
+                message += f" ({failed_count} zones failed to export)"
+            if unchanged_count:
+                message += f" ({unchanged_count} unchanged zones kept)"
+            
+            logger.info(f"Bulk export completed: {exported_count}/{total_zones} zones exported")
+            return True, message
                 
+        except OperationCancelled:
+            raise
         except Exception as e:
             logger.error(f"Bulk export failed: {e}")
             return False, f"Bulk export failed: {str(e)}"
@@ -1393,4 +1393,6 @@ class MainWindow(FluentWindow):
     def closeEvent(self, event):
         self.config_manager.save_config()
         self.api_queue.stop()
+        self.export_interface.stop_worker()
+        self.import_interface.stop_worker()
         event.accept()